@@ -0,0 +1,11 @@
+from src.aes.core import N_BYTES_IN_BLOCK
+from src.aes.key import get_aes_key
+from src.utils.modes import cbc_encrypt, cbc_decrypt
+
+
+def aes_cbc_encrypt(data: bytes, key: bytes, iv: bytes) -> bytes:
+    return cbc_encrypt(data, iv, get_aes_key(key).encrypt_block, N_BYTES_IN_BLOCK)
+
+
+def aes_cbc_decrypt(data: bytes, key: bytes, iv: bytes, n_workers=None) -> bytes:
+    return cbc_decrypt(data, iv, get_aes_key(key).decrypt_block, N_BYTES_IN_BLOCK, n_workers)
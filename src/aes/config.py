@@ -1,5 +1,11 @@
 APPENDED_BYTE = "00"
 
+# number of expanded keys kept by get_aes_key
+AES_KEY_CACHE_SIZE = 256
+
+# number of CTR keystream blocks produced by one encrypt_blocks call (or one worker task)
+CTR_BLOCKS_IN_BATCH = 4096
+
 # fmt: off
 BIAS_SHIFTS = (0, 1, 2, 3)
 
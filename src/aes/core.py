@@ -0,0 +1,147 @@
+"""AES-128 block engine on 32-bit column words with merged T-table rounds."""
+
+from typing import Tuple
+
+from src.aes.config import RCON, S_BOX, GALOIS_MUL, INVERSE_SUB_BOX, MIX_COLUMN_MATRIX, INVERSE_MIX_COLUMN_MATRIX
+
+N_BYTES_IN_BLOCK = 16
+N_WORDS_IN_BLOCK = 4
+N_ROUNDS = 10
+WORD_MASK = 0xFFFFFFFF
+
+FLAT_S_BOX = tuple(byte for row in S_BOX for byte in row)
+FLAT_INVERSE_S_BOX = tuple(byte for row in INVERSE_SUB_BOX for byte in row)
+
+
+def galois_mul(first_value, second_value):
+    if first_value == 1:
+        return second_value
+    else:
+        return GALOIS_MUL[first_value][second_value]
+
+
+def rotate_word_right(word, shift_value):
+    return ((word >> shift_value) | (word << (32 - shift_value))) & WORD_MASK
+
+
+def build_t_tables(s_box, mix_column_matrix):
+    """Returns four tables: T0[x] is the MixColumns column of S(x) in row 0, T1..T3 are its byte rotations."""
+
+    first_table = []
+    for byte in range(256):
+        substituted = s_box[byte]
+        word = 0
+        for row in mix_column_matrix:
+            word = (word << 8) | galois_mul(row[0], substituted)
+        first_table.append(word)
+    return tuple(tuple(rotate_word_right(word, 8 * i) for word in first_table) for i in range(4))
+
+
+TE0, TE1, TE2, TE3 = build_t_tables(FLAT_S_BOX, MIX_COLUMN_MATRIX)
+TD0, TD1, TD2, TD3 = build_t_tables(FLAT_INVERSE_S_BOX, INVERSE_MIX_COLUMN_MATRIX)
+
+
+def inverse_mix_column(word):
+    # TD tables start with the inverse S-box, so the forward S-box cancels it out.
+    return (
+        TD0[FLAT_S_BOX[word >> 24]]
+        ^ TD1[FLAT_S_BOX[(word >> 16) & 0xFF]]
+        ^ TD2[FLAT_S_BOX[(word >> 8) & 0xFF]]
+        ^ TD3[FLAT_S_BOX[word & 0xFF]]
+    )
+
+
+def final_round_word(first_word, second_word, third_word, fourth_word, s_box):
+    """SubBytes of the last round: each row byte is taken from its shifted column."""
+
+    return (
+        (s_box[first_word >> 24] << 24)
+        | (s_box[(second_word >> 16) & 0xFF] << 16)
+        | (s_box[(third_word >> 8) & 0xFF] << 8)
+        | s_box[fourth_word & 0xFF]
+    )
+
+
+def sub_word(word):
+    return final_round_word(word, word, word, word, FLAT_S_BOX)
+
+
+def words_to_block(first_word, second_word, third_word, fourth_word):
+    block_as_int = (first_word << 96) | (second_word << 64) | (third_word << 32) | fourth_word
+    return block_as_int.to_bytes(N_BYTES_IN_BLOCK, "big")
+
+
+def expand_key(key: bytes) -> Tuple[int, ...]:
+    """16-byte key -> 44 round key words in encryption order."""
+
+    if len(key) != N_BYTES_IN_BLOCK:
+        raise ValueError(f"AES-128 key must be exactly {N_BYTES_IN_BLOCK} bytes long.")
+    words = [int.from_bytes(key[i : i + 4], "big") for i in range(0, N_BYTES_IN_BLOCK, 4)]
+    for i in range(N_ROUNDS):
+        new_word = sub_word(rotate_word_right(words[-1], 24)) ^ (RCON[i][0] << 24) ^ words[-4]
+        words.append(new_word)
+        for j in range(N_WORDS_IN_BLOCK - 1):
+            words.append(words[-1] ^ words[-4])
+    return tuple(words)
+
+
+def get_inverse_round_keys(round_keys: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Round keys of the equivalent inverse cipher: reversed order, InvMixColumns applied to the inner rounds."""
+
+    inverse_round_keys = []
+    for round_number in range(N_ROUNDS, -1, -1):
+        words = round_keys[round_number * N_WORDS_IN_BLOCK : (round_number + 1) * N_WORDS_IN_BLOCK]
+        if 0 < round_number < N_ROUNDS:
+            words = [inverse_mix_column(word) for word in words]
+        inverse_round_keys.extend(words)
+    return tuple(inverse_round_keys)
+
+
+def encrypt_block(block: bytes, round_keys: Tuple[int, ...]) -> bytes:
+    te0, te1, te2, te3, s_box = TE0, TE1, TE2, TE3, FLAT_S_BOX
+    s0 = int.from_bytes(block[0:4], "big") ^ round_keys[0]
+    s1 = int.from_bytes(block[4:8], "big") ^ round_keys[1]
+    s2 = int.from_bytes(block[8:12], "big") ^ round_keys[2]
+    s3 = int.from_bytes(block[12:16], "big") ^ round_keys[3]
+    for k in range(4, N_ROUNDS * N_WORDS_IN_BLOCK, 4):
+        # fmt: off
+        s0, s1, s2, s3 = (
+            te0[s0 >> 24] ^ te1[(s1 >> 16) & 0xFF] ^ te2[(s2 >> 8) & 0xFF] ^ te3[s3 & 0xFF] ^ round_keys[k],
+            te0[s1 >> 24] ^ te1[(s2 >> 16) & 0xFF] ^ te2[(s3 >> 8) & 0xFF] ^ te3[s0 & 0xFF] ^ round_keys[k + 1],
+            te0[s2 >> 24] ^ te1[(s3 >> 16) & 0xFF] ^ te2[(s0 >> 8) & 0xFF] ^ te3[s1 & 0xFF] ^ round_keys[k + 2],
+            te0[s3 >> 24] ^ te1[(s0 >> 16) & 0xFF] ^ te2[(s1 >> 8) & 0xFF] ^ te3[s2 & 0xFF] ^ round_keys[k + 3],
+        )
+        # fmt: on
+    k = N_ROUNDS * N_WORDS_IN_BLOCK
+    return words_to_block(
+        final_round_word(s0, s1, s2, s3, s_box) ^ round_keys[k],
+        final_round_word(s1, s2, s3, s0, s_box) ^ round_keys[k + 1],
+        final_round_word(s2, s3, s0, s1, s_box) ^ round_keys[k + 2],
+        final_round_word(s3, s0, s1, s2, s_box) ^ round_keys[k + 3],
+    )
+
+
+def decrypt_block(block: bytes, inverse_round_keys: Tuple[int, ...]) -> bytes:
+    """inverse_round_keys are produced by get_inverse_round_keys."""
+
+    td0, td1, td2, td3, s_box = TD0, TD1, TD2, TD3, FLAT_INVERSE_S_BOX
+    s0 = int.from_bytes(block[0:4], "big") ^ inverse_round_keys[0]
+    s1 = int.from_bytes(block[4:8], "big") ^ inverse_round_keys[1]
+    s2 = int.from_bytes(block[8:12], "big") ^ inverse_round_keys[2]
+    s3 = int.from_bytes(block[12:16], "big") ^ inverse_round_keys[3]
+    for k in range(4, N_ROUNDS * N_WORDS_IN_BLOCK, 4):
+        # fmt: off
+        s0, s1, s2, s3 = (
+            td0[s0 >> 24] ^ td1[(s3 >> 16) & 0xFF] ^ td2[(s2 >> 8) & 0xFF] ^ td3[s1 & 0xFF] ^ inverse_round_keys[k],
+            td0[s1 >> 24] ^ td1[(s0 >> 16) & 0xFF] ^ td2[(s3 >> 8) & 0xFF] ^ td3[s2 & 0xFF] ^ inverse_round_keys[k + 1],
+            td0[s2 >> 24] ^ td1[(s1 >> 16) & 0xFF] ^ td2[(s0 >> 8) & 0xFF] ^ td3[s3 & 0xFF] ^ inverse_round_keys[k + 2],
+            td0[s3 >> 24] ^ td1[(s2 >> 16) & 0xFF] ^ td2[(s1 >> 8) & 0xFF] ^ td3[s0 & 0xFF] ^ inverse_round_keys[k + 3],
+        )
+        # fmt: on
+    k = N_ROUNDS * N_WORDS_IN_BLOCK
+    return words_to_block(
+        final_round_word(s0, s3, s2, s1, s_box) ^ inverse_round_keys[k],
+        final_round_word(s1, s0, s3, s2, s_box) ^ inverse_round_keys[k + 1],
+        final_round_word(s2, s1, s0, s3, s_box) ^ inverse_round_keys[k + 2],
+        final_round_word(s3, s2, s1, s0, s_box) ^ inverse_round_keys[k + 3],
+    )
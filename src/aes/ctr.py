@@ -0,0 +1,74 @@
+"""AES-128 in counter (CTR) mode with a 128-bit big-endian counter."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.aes.config import CTR_BLOCKS_IN_BATCH
+from src.aes.core import N_BYTES_IN_BLOCK
+from src.aes.vectorized import encrypt_blocks
+
+COUNTER_MODULO = 2 ** (8 * N_BYTES_IN_BLOCK)
+HALF_BLOCK_MASK = 2 ** 64 - 1
+
+
+def get_counter_blocks(initial_counter: bytes, first_block: int, n_blocks: int) -> np.ndarray:
+    """Counter blocks first_block, ..., first_block + n_blocks - 1 as an (n_blocks, 16) uint8 array."""
+
+    if len(initial_counter) != N_BYTES_IN_BLOCK:
+        raise ValueError(f"Initial counter block must be exactly {N_BYTES_IN_BLOCK} bytes long.")
+    start = (int.from_bytes(initial_counter, "big") + first_block) % COUNTER_MODULO
+    low_start = np.uint64(start & HALF_BLOCK_MASK)
+    # uint64 addition wraps around, a wrapped low half carries one into the high half.
+    low_halves = low_start + np.arange(n_blocks, dtype=np.uint64)
+    high_halves = np.uint64(start >> 64) + (low_halves < low_start).astype(np.uint64)
+
+    counters = np.empty((n_blocks, 2), dtype=">u8")
+    counters[:, 0] = high_halves
+    counters[:, 1] = low_halves
+    return counters.view(np.uint8).reshape(n_blocks, N_BYTES_IN_BLOCK)
+
+
+def get_keystream(key: bytes, initial_counter: bytes, first_block: int, n_blocks: int) -> bytes:
+    return encrypt_blocks(get_counter_blocks(initial_counter, first_block, n_blocks), key).tobytes()
+
+
+def get_keystream_batches(key, initial_counter, first_block, n_blocks, blocks_in_batch, n_workers):
+    batch_starts = list(range(first_block, first_block + n_blocks, blocks_in_batch))
+    batch_sizes = [min(blocks_in_batch, first_block + n_blocks - start) for start in batch_starts]
+    batch_args = (
+        [key] * len(batch_starts),
+        [initial_counter] * len(batch_starts),
+        batch_starts,
+        batch_sizes,
+    )
+    if n_workers is None or len(batch_starts) < 2:
+        yield from map(get_keystream, *batch_args)
+    else:
+        with ProcessPoolExecutor(n_workers) as executor:
+            yield from executor.map(get_keystream, *batch_args)
+
+
+def aes_ctr_encrypt(
+    data: bytes, key: bytes, initial_counter: bytes, offset=0, n_workers=None, blocks_in_batch=CTR_BLOCKS_IN_BATCH
+) -> bytes:
+    """Encrypts (or decrypts) data that starts at byte offset of the stream, without padding."""
+
+    data = np.frombuffer(data, dtype=np.uint8)
+    first_block, skipped_bytes = divmod(offset, N_BYTES_IN_BLOCK)
+    n_blocks = -(-(skipped_bytes + data.size) // N_BYTES_IN_BLOCK)
+
+    result = np.empty_like(data)
+    position = -skipped_bytes
+    for keystream in get_keystream_batches(
+        bytes(key), bytes(initial_counter), first_block, n_blocks, blocks_in_batch, n_workers
+    ):
+        keystream = np.frombuffer(keystream, dtype=np.uint8)
+        start = max(position, 0)
+        end = min(position + keystream.size, data.size)
+        result[start:end] = data[start:end] ^ keystream[start - position : end - position]
+        position += keystream.size
+    return result.tobytes()
+
+
+aes_ctr_decrypt = aes_ctr_encrypt
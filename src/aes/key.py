@@ -0,0 +1,46 @@
+from functools import lru_cache
+
+from src.aes.config import AES_KEY_CACHE_SIZE
+from src.aes.core import N_BYTES_IN_BLOCK, expand_key, get_inverse_round_keys, encrypt_block, decrypt_block
+
+
+class AESKey:
+    """An AES-128 key with its encryption and inverse round keys expanded once."""
+
+    block_size = N_BYTES_IN_BLOCK
+
+    def __init__(self, key: bytes):
+        self.key = bytes(key)
+        self.round_keys = expand_key(self.key)
+        self.inverse_round_keys = get_inverse_round_keys(self.round_keys)
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        return encrypt_block(block, self.round_keys)
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        return decrypt_block(block, self.inverse_round_keys)
+
+    def __reduce__(self):
+        # Worker processes rebuild the key through their own cache instead of unpickling the schedules.
+        return get_aes_key, (self.key,)
+
+
+@lru_cache(maxsize=AES_KEY_CACHE_SIZE)
+def get_cached_aes_key(key: bytes) -> AESKey:
+    return AESKey(key)
+
+
+def get_aes_key(key) -> AESKey:
+    """Returns the expanded key from the LRU cache, see get_aes_key_cache_info() for statistics."""
+
+    return get_cached_aes_key(bytes(key))
+
+
+def get_aes_key_cache_info():
+    """Named tuple with hits, misses, maxsize and currsize of the expanded key cache."""
+
+    return get_cached_aes_key.cache_info()
+
+
+def clear_aes_key_cache():
+    get_cached_aes_key.cache_clear()
@@ -0,0 +1,83 @@
+"""Batched AES-128 on (N, 16) uint8 arrays of blocks."""
+
+import numpy as np
+
+from src.aes.config import BIAS_SHIFTS, GALOIS_MUL, MIX_COLUMN_MATRIX, INVERSE_MIX_COLUMN_MATRIX
+from src.aes.core import N_BYTES_IN_BLOCK, N_WORDS_IN_BLOCK, N_ROUNDS, FLAT_S_BOX, FLAT_INVERSE_S_BOX
+from src.aes.key import AESKey, get_aes_key
+
+N_BYTES_IN_WORD = 4
+
+S_BOX_ARRAY = np.array(FLAT_S_BOX, dtype=np.uint8)
+INVERSE_S_BOX_ARRAY = np.array(FLAT_INVERSE_S_BOX, dtype=np.uint8)
+GALOIS_MUL_ARRAYS = {1: np.arange(256, dtype=np.uint8)}
+GALOIS_MUL_ARRAYS.update({factor: np.array(table, dtype=np.uint8) for factor, table in GALOIS_MUL.items()})
+
+SHIFT_ROWS_INDEXES = np.array(
+    [
+        N_BYTES_IN_WORD * ((column + BIAS_SHIFTS[row]) % N_WORDS_IN_BLOCK) + row
+        for column in range(N_WORDS_IN_BLOCK)
+        for row in range(N_BYTES_IN_WORD)
+    ]
+)
+INVERSE_SHIFT_ROWS_INDEXES = np.argsort(SHIFT_ROWS_INDEXES)
+
+
+def to_blocks_array(blocks) -> np.ndarray:
+    """bytes-like object with a length multiple of 16 or an (N, 16) array -> (N, 16) uint8 array."""
+
+    if isinstance(blocks, np.ndarray):
+        array = blocks.astype(np.uint8, copy=False)
+    else:
+        array = np.frombuffer(blocks, dtype=np.uint8)
+    if array.size % N_BYTES_IN_BLOCK != 0:
+        raise ValueError(f"Data length must be a multiple of {N_BYTES_IN_BLOCK} bytes.")
+    return array.reshape(-1, N_BYTES_IN_BLOCK)
+
+
+def get_round_keys_array(round_keys) -> np.ndarray:
+    """Round key words -> (N_ROUNDS + 1, 16) uint8 array."""
+
+    return np.frombuffer(b"".join(word.to_bytes(4, "big") for word in round_keys), dtype=np.uint8).reshape(
+        N_ROUNDS + 1, N_BYTES_IN_BLOCK
+    )
+
+
+def mix_columns(state, mix_column_matrix):
+    columns = state.reshape(-1, N_WORDS_IN_BLOCK, N_BYTES_IN_WORD)
+    result = np.empty_like(columns)
+    for i, matrix_row in enumerate(mix_column_matrix):
+        result[:, :, i] = GALOIS_MUL_ARRAYS[matrix_row[0]][columns[:, :, 0]]
+        for j in range(1, N_BYTES_IN_WORD):
+            result[:, :, i] ^= GALOIS_MUL_ARRAYS[matrix_row[j]][columns[:, :, j]]
+    return result.reshape(-1, N_BYTES_IN_BLOCK)
+
+
+def get_key(key) -> AESKey:
+    return key if isinstance(key, AESKey) else get_aes_key(key)
+
+
+def encrypt_blocks(blocks, key) -> np.ndarray:
+    """Encrypts every block independently (ECB). key is an AESKey or 16 key bytes."""
+
+    round_keys = get_round_keys_array(get_key(key).round_keys)
+    state = to_blocks_array(blocks) ^ round_keys[0]
+    for i in range(1, N_ROUNDS):
+        state = S_BOX_ARRAY[state[:, SHIFT_ROWS_INDEXES]]
+        state = mix_columns(state, MIX_COLUMN_MATRIX)
+        state ^= round_keys[i]
+    state = S_BOX_ARRAY[state[:, SHIFT_ROWS_INDEXES]]
+    state ^= round_keys[N_ROUNDS]
+    return state
+
+
+def decrypt_blocks(blocks, key) -> np.ndarray:
+    round_keys = get_round_keys_array(get_key(key).round_keys)
+    state = to_blocks_array(blocks) ^ round_keys[N_ROUNDS]
+    for i in range(N_ROUNDS - 1, 0, -1):
+        state = INVERSE_S_BOX_ARRAY[state[:, INVERSE_SHIFT_ROWS_INDEXES]]
+        state ^= round_keys[i]
+        state = mix_columns(state, INVERSE_MIX_COLUMN_MATRIX)
+    state = INVERSE_S_BOX_ARRAY[state[:, INVERSE_SHIFT_ROWS_INDEXES]]
+    state ^= round_keys[0]
+    return state
@@ -0,0 +1,107 @@
+"""DES on native ints with byte-indexed permutation tables and SP-boxes."""
+
+from typing import Tuple
+
+from src.des.config import (
+    IP_PERMUTATION,
+    EXTENSION_TABLE,
+    BASIC_CONVERSION_TABLES,
+    FINAL_DES_FUNCTION_PERMUTATION,
+    REVERSE_IP_PERMUTATION,
+    INITIAL_KEY_PERMUTATION,
+    ROUND_KEYS_SHIFTS,
+    FINAL_KEY_PERMUTATION,
+)
+
+BLOCK_WIDTH = 64
+HALF_BLOCK_WIDTH = 32
+KEY_WIDTH = 56
+HALF_KEY_WIDTH = 28
+ROUND_KEY_WIDTH = 48
+SBOX_INPUT_WIDTH = 6
+SBOX_OUTPUT_WIDTH = 4
+
+
+def permute_bits(number, permutation: Tuple, input_width):
+    result = 0
+    for position in permutation:
+        result = (result << 1) | ((number >> (input_width - position)) & 1)
+    return result
+
+
+def build_permutation_tables(permutation: Tuple, input_width):
+    """tables[j][byte] is the permuted value of an input that only has byte j (from the left) set to byte."""
+
+    return tuple(
+        tuple(permute_bits(byte << (input_width - 8 * (j + 1)), permutation, input_width) for byte in range(256))
+        for j in range(input_width // 8)
+    )
+
+
+def apply_permutation_tables(number, tables, input_width):
+    result = 0
+    for j, table in enumerate(tables):
+        result |= table[(number >> (input_width - 8 * (j + 1))) & 0xFF]
+    return result
+
+
+IP_TABLES = build_permutation_tables(IP_PERMUTATION, BLOCK_WIDTH)
+REVERSE_IP_TABLES = build_permutation_tables(REVERSE_IP_PERMUTATION, BLOCK_WIDTH)
+EXTENSION_TABLES = build_permutation_tables(EXTENSION_TABLE, HALF_BLOCK_WIDTH)
+INITIAL_KEY_TABLES = build_permutation_tables(INITIAL_KEY_PERMUTATION, BLOCK_WIDTH)
+
+
+def build_sp_boxes(basic_conversion_tables, final_permutation):
+    """sp_boxes[i][six_bits]: output of S-box i placed at its nibble and passed through the final permutation."""
+
+    sp_boxes = []
+    for i, table in enumerate(basic_conversion_tables):
+        shift_value = HALF_BLOCK_WIDTH - SBOX_OUTPUT_WIDTH * (i + 1)
+        sp_box = []
+        for six_bits in range(2 ** SBOX_INPUT_WIDTH):
+            row = ((six_bits >> 4) & 0b10) | (six_bits & 1)
+            column = (six_bits >> 1) & 0b1111
+            sp_box.append(permute_bits(table[row][column] << shift_value, final_permutation, HALF_BLOCK_WIDTH))
+        sp_boxes.append(tuple(sp_box))
+    return tuple(sp_boxes)
+
+
+SP_BOXES = build_sp_boxes(BASIC_CONVERSION_TABLES, FINAL_DES_FUNCTION_PERMUTATION)
+SBOX_SHIFTS = tuple(ROUND_KEY_WIDTH - SBOX_INPUT_WIDTH * (i + 1) for i in range(len(SP_BOXES)))
+
+
+def des_feistel_func(half_block, round_key):
+    bits = apply_permutation_tables(half_block, EXTENSION_TABLES, HALF_BLOCK_WIDTH) ^ round_key
+    result = 0
+    for sp_box, shift_value in zip(SP_BOXES, SBOX_SHIFTS):
+        result |= sp_box[(bits >> shift_value) & 0b111111]
+    return result
+
+
+def add_parity_bits(key: int) -> int:
+    """56-bit key -> 64-bit key with an odd parity bit after every 7 bits."""
+
+    result = 0
+    for i in range(KEY_WIDTH // 7 - 1, -1, -1):
+        chunk = (key >> (7 * i)) & 0b1111111
+        result = (result << 8) | (chunk << 1) | (1 - bin(chunk).count("1") % 2)
+    return result
+
+
+def rotate_left(number, shift_value, width):
+    mask = (1 << width) - 1
+    return ((number << shift_value) | (number >> (width - shift_value))) & mask
+
+
+def get_round_keys(key_with_parity_bits: int) -> Tuple[int, ...]:
+    permuted_key = apply_permutation_tables(key_with_parity_bits, INITIAL_KEY_TABLES, BLOCK_WIDTH)
+    half_mask = (1 << HALF_KEY_WIDTH) - 1
+    c = permuted_key >> HALF_KEY_WIDTH
+    d = permuted_key & half_mask
+    round_keys = []
+    for shift_value in ROUND_KEYS_SHIFTS:
+        c = rotate_left(c, shift_value, HALF_KEY_WIDTH)
+        d = rotate_left(d, shift_value, HALF_KEY_WIDTH)
+        round_keys.append(permute_bits((c << HALF_KEY_WIDTH) | d, FINAL_KEY_PERMUTATION, KEY_WIDTH))
+    return tuple(round_keys)
+
@@ -0,0 +1,41 @@
+from src.des.core import BLOCK_WIDTH, HALF_BLOCK_WIDTH, IP_TABLES, REVERSE_IP_TABLES
+from src.des.core import add_parity_bits, get_round_keys, apply_permutation_tables, des_feistel_func
+from src.des.utils.feistel_cipher import feistel_encrypt
+
+N_BYTES_IN_BLOCK = 8
+N_BYTES_IN_KEY = 7
+N_BYTES_IN_KEY_WITH_PARITY = 8
+
+
+class DESKey:
+    """A DES key of 7 or 8 bytes with its 16 round keys in encryption and decryption order."""
+
+    block_size = N_BYTES_IN_BLOCK
+
+    def __init__(self, key: bytes):
+        if len(key) == N_BYTES_IN_KEY:
+            key_with_parity_bits = add_parity_bits(int.from_bytes(key, "big"))
+        elif len(key) == N_BYTES_IN_KEY_WITH_PARITY:
+            key_with_parity_bits = int.from_bytes(key, "big")
+        else:
+            raise ValueError(f"DES key must be {N_BYTES_IN_KEY} or {N_BYTES_IN_KEY_WITH_PARITY} bytes long.")
+        self.key = bytes(key)
+        self.round_keys = get_round_keys(key_with_parity_bits)
+        self.inverse_round_keys = self.round_keys[::-1]
+
+    def process_feistel(self, block: int, encrypt=True) -> int:
+        """16 rounds without the initial and final permutations."""
+
+        keys = self.round_keys if encrypt else self.inverse_round_keys
+        return feistel_encrypt(block, keys, des_feistel_func, HALF_BLOCK_WIDTH)
+
+    def process_int_block(self, block: int, encrypt=True) -> int:
+        block = apply_permutation_tables(block, IP_TABLES, BLOCK_WIDTH)
+        block = self.process_feistel(block, encrypt)
+        return apply_permutation_tables(block, REVERSE_IP_TABLES, BLOCK_WIDTH)
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        return self.process_int_block(int.from_bytes(block, "big")).to_bytes(N_BYTES_IN_BLOCK, "big")
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        return self.process_int_block(int.from_bytes(block, "big"), encrypt=False).to_bytes(N_BYTES_IN_BLOCK, "big")
@@ -0,0 +1,57 @@
+"""Triple DES in the EDE form: C = E_K3(D_K2(E_K1(P))), K3 = K1 for two keys."""
+
+from src.des.core import BLOCK_WIDTH, IP_TABLES, REVERSE_IP_TABLES, apply_permutation_tables
+from src.des.key import DESKey, N_BYTES_IN_BLOCK
+from src.utils.modes import cbc_encrypt, cbc_decrypt, ecb_apply
+
+
+class TripleDESKey:
+    block_size = N_BYTES_IN_BLOCK
+
+    def __init__(self, first_key: bytes, second_key: bytes, third_key: bytes = None):
+        self.first_key = DESKey(first_key)
+        self.second_key = DESKey(second_key)
+        self.third_key = self.first_key if third_key is None else DESKey(third_key)
+
+    def process_int_block(self, block: int, encrypt=True) -> int:
+        block = apply_permutation_tables(block, IP_TABLES, BLOCK_WIDTH)
+        if encrypt:
+            block = self.first_key.process_feistel(block)
+            block = self.second_key.process_feistel(block, encrypt=False)
+            block = self.third_key.process_feistel(block)
+        else:
+            block = self.third_key.process_feistel(block, encrypt=False)
+            block = self.second_key.process_feistel(block)
+            block = self.first_key.process_feistel(block, encrypt=False)
+        return apply_permutation_tables(block, REVERSE_IP_TABLES, BLOCK_WIDTH)
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        return self.process_int_block(int.from_bytes(block, "big")).to_bytes(N_BYTES_IN_BLOCK, "big")
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        return self.process_int_block(int.from_bytes(block, "big"), encrypt=False).to_bytes(N_BYTES_IN_BLOCK, "big")
+
+
+def check_block_alignment(data):
+    if len(data) % N_BYTES_IN_BLOCK != 0:
+        raise ValueError(f"Data length must be a multiple of {N_BYTES_IN_BLOCK} bytes.")
+
+
+def triple_des_ecb_encrypt(data: bytes, key: TripleDESKey) -> bytes:
+    """No padding is added."""
+
+    check_block_alignment(data)
+    return ecb_apply(key.encrypt_block, data, N_BYTES_IN_BLOCK)
+
+
+def triple_des_ecb_decrypt(data: bytes, key: TripleDESKey) -> bytes:
+    check_block_alignment(data)
+    return ecb_apply(key.decrypt_block, data, N_BYTES_IN_BLOCK)
+
+
+def triple_des_cbc_encrypt(data: bytes, key: TripleDESKey, iv: bytes) -> bytes:
+    return cbc_encrypt(data, iv, key.encrypt_block, N_BYTES_IN_BLOCK)
+
+
+def triple_des_cbc_decrypt(data: bytes, key: TripleDESKey, iv: bytes, n_workers=None) -> bytes:
+    return cbc_decrypt(data, iv, key.decrypt_block, N_BYTES_IN_BLOCK, n_workers)
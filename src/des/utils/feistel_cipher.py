@@ -1,14 +1,11 @@
-from src.utils.encodings_processing import xor_string
-
-
-def feistel_encrypt(binary_string, keys, encryption_func):
-    center = len(binary_string) // 2
-    left = binary_string[:center]
-    right = binary_string[center:]
+def feistel_encrypt(block: int, keys, encryption_func, half_width=32):
+    half_mask = (1 << half_width) - 1
+    left = block >> half_width
+    right = block & half_mask
     for key in keys:
-        left, right = right, xor_string(encryption_func(right, key), left)
-    return right + left
+        left, right = right, encryption_func(right, key) ^ left
+    return (right << half_width) | left
 
 
-def feistel_decrypt(binary_string, keys, encryption_func):
-    return feistel_encrypt(binary_string, keys[::-1], encryption_func)
+def feistel_decrypt(block: int, keys, encryption_func, half_width=32):
+    return feistel_encrypt(block, keys[::-1], encryption_func, half_width)
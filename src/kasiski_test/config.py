@@ -0,0 +1,24 @@
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# longest key length tried by the Vigenere pipeline and counted by the streaming Kasiski examination
+MAX_KEY_LENGTH = 40
+
+# number of best ranked key lengths whose keys are recovered and reported
+N_KEY_LENGTH_CANDIDATES = 6
+
+# bytes of a file read at once by the streaming Kasiski examination
+STREAM_CHUNK_SIZE = 2 ** 20
+
+# shortest and longest repeated substrings used for the Kasiski part of the ranking
+KASISKI_SUBSTRING_LENGTHS = range(3, 6)
+
+# relative frequencies of a..z
+# fmt: off
+LETTER_FREQUENCIES = {
+    "english": (
+        0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+        0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+        0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+    ),
+}
+# fmt: on
@@ -0,0 +1,80 @@
+"""Divisors of repeat distances from a smallest prime factor sieve."""
+
+import numpy as np
+
+# an index is rebuilt at least this large, so short texts analysed one after another share it
+MIN_INDEX_LIMIT = 2 ** 16
+
+
+def get_smallest_prime_factors(limit) -> np.ndarray:
+    """smallest_prime_factors[k] for 2 <= k <= limit."""
+
+    smallest_prime_factors = np.zeros(limit + 1, dtype=np.int32)
+    for i in range(2, int(limit ** 0.5) + 1):
+        if smallest_prime_factors[i] == 0:
+            multiples = smallest_prime_factors[i * i :: i]
+            multiples[multiples == 0] = i
+    is_prime = smallest_prime_factors == 0
+    smallest_prime_factors[is_prime] = np.arange(limit + 1, dtype=np.int32)[is_prime]
+    return smallest_prime_factors
+
+
+class DivisorIndex:
+    def __init__(self, limit):
+        self.limit = limit
+        self.smallest_prime_factors = get_smallest_prime_factors(limit)
+
+    def get_divisor_lists(self, numbers: np.ndarray):
+        """(owners, divisors): divisors[i] is a divisor of numbers[owners[i]], every divisor of every number once."""
+
+        numbers = np.asarray(numbers, dtype=np.int64)
+        if len(numbers) and (numbers.min() < 1 or numbers.max() > self.limit):
+            raise ValueError(f"Numbers must be between 1 and {self.limit}.")
+        owners = np.arange(len(numbers))
+        divisors = np.ones(len(numbers), dtype=np.int64)
+        rests = numbers.copy()
+
+        while True:
+            active = np.flatnonzero(rests > 1)
+            if len(active) == 0:
+                return owners, divisors
+            primes = self.smallest_prime_factors[rests[active]].astype(np.int64)
+            powers = np.zeros(len(active), dtype=np.int64)
+            is_divisible = np.ones(len(active), dtype=bool)
+            while is_divisible.any():
+                rests[active[is_divisible]] //= primes[is_divisible]
+                powers[is_divisible] += 1
+                is_divisible = rests[active] % primes == 0
+
+            # every divisor of an active number is repeated powers + 1 times and multiplied by prime^0..prime^powers
+            all_powers = np.zeros(len(numbers), dtype=np.int64)
+            all_powers[active] = powers
+            all_primes = np.ones(len(numbers), dtype=np.int64)
+            all_primes[active] = primes
+            n_copies = all_powers[owners] + 1
+            new_owners = np.repeat(owners, n_copies)
+            copy_starts = np.cumsum(n_copies) - n_copies
+            exponents = np.arange(len(new_owners)) - np.repeat(copy_starts, n_copies)
+            divisors = np.repeat(divisors, n_copies) * all_primes[new_owners] ** exponents
+            owners = new_owners
+
+    def spread(self, numbers: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """totals[d] = sum of counts[i] over the numbers[i] divisible by d, equal numbers are merged first."""
+
+        numbers, inverse = np.unique(np.asarray(numbers, dtype=np.int64), return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=counts, minlength=len(numbers))
+        owners, divisors = self.get_divisor_lists(numbers)
+        totals = np.bincount(divisors, weights=counts[owners], minlength=int(numbers.max(initial=0)) + 1)
+        return np.rint(totals).astype(np.int64)
+
+
+DIVISOR_INDEX = None
+
+
+def get_divisor_index(limit) -> DivisorIndex:
+    """A shared index for numbers up to at least limit, rebuilt at least twice as large when it is too small."""
+
+    global DIVISOR_INDEX
+    if DIVISOR_INDEX is None or DIVISOR_INDEX.limit < limit:
+        DIVISOR_INDEX = DivisorIndex(max(limit, 2 * DIVISOR_INDEX.limit if DIVISOR_INDEX else 0, MIN_INDEX_LIMIT))
+    return DIVISOR_INDEX
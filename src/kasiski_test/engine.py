@@ -0,0 +1,106 @@
+"""Kasiski examination of long texts with sort-based n-gram repeat search."""
+
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.kasiski_test.divisors import get_divisor_index
+
+MAX_PACKED_KEY = 2 ** 64
+DISTANCE_HISTOGRAMS_CACHE_SIZE = 64
+
+# (text digest, substring length) -> (distinct distances, numbers of repeats)
+DISTANCE_HISTOGRAMS = OrderedDict()
+
+
+def encode_text(text: str) -> np.ndarray:
+    """Codes 0, 1, ... of the distinct characters of text in their sorted order, in the smallest unsigned type."""
+
+    characters = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    alphabet, codes = np.unique(characters, return_inverse=True)
+    return codes.astype(np.min_scalar_type(max(len(alphabet) - 1, 0))).ravel()
+
+
+def get_ngram_keys(codes: np.ndarray, substring_length) -> np.ndarray:
+    """Equal keys for equal n-grams: numbers in base alphabet size if they fit into uint64, raw bytes otherwise."""
+
+    n_ngrams = len(codes) - substring_length + 1
+    base = int(codes.max()) + 1
+    if base ** substring_length > MAX_PACKED_KEY:
+        windows = np.ascontiguousarray(sliding_window_view(codes, substring_length))
+        return windows.view(np.dtype((np.void, substring_length * codes.itemsize))).ravel()
+
+    keys = np.zeros(n_ngrams, dtype=np.uint64)
+    for i in range(substring_length):
+        keys = keys * np.uint64(base) + codes[i : i + n_ngrams]
+    return keys
+
+
+def get_repeat_distances(codes: np.ndarray, substring_length) -> np.ndarray:
+    """Distances between consecutive occurrences of every n-gram."""
+
+    if len(codes) <= substring_length:
+        return np.empty(0, dtype=np.int64)
+    keys = get_ngram_keys(codes, substring_length)
+    positions = np.argsort(keys, kind="stable")
+    sorted_keys = keys[positions]
+    is_repeat = sorted_keys[1:] == sorted_keys[:-1]
+    return (positions[1:] - positions[:-1])[is_repeat]
+
+
+def get_distance_histogram(codes: np.ndarray, substring_length) -> Tuple[np.ndarray, np.ndarray]:
+    return np.unique(get_repeat_distances(codes, substring_length), return_counts=True)
+
+
+def get_distance_histograms(codes: np.ndarray, substring_lengths: Iterable[int], n_workers=None):
+    """Histograms for every substring length, the missing ones are computed in a process pool if n_workers is set."""
+
+    text_digest = hashlib.blake2b(codes.dtype.str.encode() + codes.tobytes()).digest()
+    keys = [(text_digest, substring_length) for substring_length in substring_lengths]
+    missing_lengths = [key[1] for key in keys if key not in DISTANCE_HISTOGRAMS]
+
+    get_histogram = partial(get_distance_histogram, codes)
+    if n_workers is None or len(missing_lengths) < 2:
+        histograms = dict(zip(missing_lengths, map(get_histogram, missing_lengths)))
+    else:
+        with ProcessPoolExecutor(n_workers) as executor:
+            histograms = dict(zip(missing_lengths, executor.map(get_histogram, missing_lengths)))
+
+    result = []
+    for key in keys:
+        if key not in DISTANCE_HISTOGRAMS:
+            DISTANCE_HISTOGRAMS[key] = histograms[key[1]]
+        DISTANCE_HISTOGRAMS.move_to_end(key)
+        result.append(DISTANCE_HISTOGRAMS[key])
+    while len(DISTANCE_HISTOGRAMS) > DISTANCE_HISTOGRAMS_CACHE_SIZE:
+        DISTANCE_HISTOGRAMS.popitem(last=False)
+    return result
+
+
+def count_divisors(histograms) -> Counter:
+    """Number of repeats in histograms whose distance is divisible by every length."""
+
+    distances = np.concatenate([np.empty(0, dtype=np.int64)] + [distances for distances, _ in histograms])
+    counts = np.concatenate([np.empty(0, dtype=np.int64)] + [counts for _, counts in histograms])
+    if len(distances) == 0:
+        return Counter()
+    totals = get_divisor_index(int(distances.max())).spread(distances, counts)
+    lengths = np.flatnonzero(totals)
+    return Counter(dict(zip(lengths.tolist(), totals[lengths].tolist())))
+
+
+def get_possible_lengths(codes: np.ndarray, substring_length) -> Counter:
+    """Number of repeats of n-grams of substring_length characters whose distance is divisible by every length."""
+
+    return count_divisors(get_distance_histograms(codes, [substring_length]))
+
+
+def analyze(text: str, substring_lengths: Iterable[int] = range(3, 6), n_workers=None) -> Counter:
+    """Sum of get_possible_lengths over substring_lengths."""
+
+    return count_divisors(get_distance_histograms(encode_text(text), list(substring_lengths), n_workers))
@@ -1,8 +1,13 @@
-from collections import Counter
+import argparse
 from math import floor, sqrt
 
+from src.kasiski_test import engine, streaming
+from src.kasiski_test.config import MAX_KEY_LENGTH
+
 
 def find_all_divisors(number):
+    """Divisors of a single number by trial division, kept as a public helper, the examination uses DivisorIndex."""
+
     divisors = set()
     for j in range(1, floor(sqrt(number) + 1)):
         if number % j == 0:
@@ -12,28 +17,32 @@ def find_all_divisors(number):
 
 
 def get_possible_lengths(text, substring_length):
-    substrings_indexes = {}
-    possible_lengths = Counter()
-
-    for j in range(len(text) - substring_length + 1):
-        substring = text[j : j + substring_length]
-        if substring not in substrings_indexes:
-            substrings_indexes.update({substring: j})
-        else:
-            possible_lengths.update(find_all_divisors(j - substrings_indexes[substring]))
-            substrings_indexes[substring] = j
+    return engine.get_possible_lengths(engine.encode_text(text), substring_length)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kasiski examination of a ciphertext.")
+    parser.add_argument("path", nargs="?", default="input.txt", help="file with the ciphertext")
+    parser.add_argument("--min-length", type=int, default=3, help="shortest repeated substring")
+    parser.add_argument("--max-length", type=int, default=3, help="longest repeated substring")
+    parser.add_argument("--workers", type=int, default=None, help="analyse substring lengths in a process pool")
+    parser.add_argument(
+        "--stream", action="store_true", help="read the file in chunks, keep letters a..z only and count short lengths"
+    )
+    parser.add_argument("--max-key-length", type=int, default=MAX_KEY_LENGTH, help="longest length counted by --stream")
+    args = parser.parse_args(argv)
+
+    substring_lengths = range(args.min_length, args.max_length + 1)
+    if args.stream:
+        all_possible_lengths = streaming.analyze_file(args.path, substring_lengths, args.max_key_length)
+    else:
+        with open(args.path, "r") as f:
+            cipher_text = f.read().lower().replace(" ", "")
+        all_possible_lengths = engine.analyze(cipher_text, substring_lengths, args.workers)
 
-    return possible_lengths
+    for length, freq in sorted(all_possible_lengths.items()):
+        print(f"{length} -- {freq}")
 
 
 if __name__ == "__main__":
-    with open("input.txt", "r") as f:
-        cipher_text = f.read().lower().replace(" ", "")
-    all_possible_lengths = Counter()
-
-    for i in range(3, 4):
-        print("a")
-        all_possible_lengths.update(get_possible_lengths(cipher_text, 3))
-
-    for length, freq in sorted(all_possible_lengths.items()):
-        print(f"{length} -- {freq}")
+    main()
@@ -0,0 +1,91 @@
+"""Kasiski examination of files of any size in constant memory."""
+
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+
+from src.kasiski_test.config import ALPHABET, MAX_KEY_LENGTH, STREAM_CHUNK_SIZE
+
+N_LETTERS = len(ALPHABET)
+# 26^6 slots of 8 bytes are about 2.5 GB
+MAX_SUBSTRING_LENGTH = 5
+
+LOWERCASE_TABLE = bytes.maketrans(ALPHABET.upper().encode(), ALPHABET.encode())
+NON_LETTER_BYTES = bytes(byte for byte in range(256) if byte not in ALPHABET.encode() + ALPHABET.upper().encode())
+
+
+def normalize_chunk(chunk: bytes) -> bytes:
+    return chunk.translate(LOWERCASE_TABLE, NON_LETTER_BYTES)
+
+
+class StreamingKasiski:
+    def __init__(self, substring_lengths: Iterable[int] = range(3, 4), max_key_length=MAX_KEY_LENGTH):
+        self.substring_lengths = list(substring_lengths)
+        if any(not 1 <= substring_length <= MAX_SUBSTRING_LENGTH for substring_length in self.substring_lengths):
+            raise ValueError(f"Substring lengths must be between 1 and {MAX_SUBSTRING_LENGTH}.")
+        self.max_key_length = max_key_length
+        self.last_positions = {
+            substring_length: np.full(N_LETTERS ** substring_length, -1, dtype=np.int64)
+            for substring_length in self.substring_lengths
+        }
+        self.counts = np.zeros(max_key_length + 1, dtype=np.int64)
+        self.tail = np.empty(0, dtype=np.uint8)
+        # position of the first letter of tail in the whole normalized text
+        self.tail_start = 0
+
+    def update(self, chunk: bytes):
+        letters = np.frombuffer(normalize_chunk(chunk), dtype=np.uint8) - ord(ALPHABET[0])
+        codes = np.concatenate([self.tail, letters])
+        for substring_length in self.substring_lengths:
+            self.count_repeats(codes, substring_length)
+
+        n_carried = min(len(codes), max(self.substring_lengths, default=1) - 1)
+        self.tail_start += len(codes) - n_carried
+        self.tail = codes[len(codes) - n_carried :]
+
+    def count_repeats(self, codes: np.ndarray, substring_length):
+        """Counts repeats of the n-grams that end in the new letters, codes start with the carried tail."""
+
+        first_ngram = max(0, len(self.tail) - substring_length + 1)
+        n_ngrams = len(codes) - substring_length + 1 - first_ngram
+        if n_ngrams <= 0:
+            return
+        keys = np.zeros(n_ngrams, dtype=np.int64)
+        for i in range(substring_length):
+            keys = keys * N_LETTERS + codes[first_ngram + i : first_ngram + i + n_ngrams]
+        positions = self.tail_start + first_ngram + np.arange(n_ngrams)
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        sorted_positions = positions[order]
+        is_first = np.ones(n_ngrams, dtype=bool)
+        is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        is_last = np.ones(n_ngrams, dtype=bool)
+        is_last[:-1] = is_first[1:]
+
+        last_positions = self.last_positions[substring_length]
+        previous_positions = np.empty(n_ngrams, dtype=np.int64)
+        previous_positions[1:] = sorted_positions[:-1]
+        previous_positions[is_first] = last_positions[sorted_keys[is_first]]
+        last_positions[sorted_keys[is_last]] = sorted_positions[is_last]
+
+        distances = (sorted_positions - previous_positions)[previous_positions >= 0]
+        for key_length in range(1, self.max_key_length + 1):
+            self.counts[key_length] += np.count_nonzero(distances % key_length == 0)
+
+    def get_possible_lengths(self) -> Counter:
+        """Number of repeats whose distance is divisible by every key length up to max_key_length."""
+
+        lengths = np.flatnonzero(self.counts)
+        return Counter(dict(zip(lengths.tolist(), self.counts[lengths].tolist())))
+
+
+def analyze_file(
+    path, substring_lengths: Iterable[int] = range(3, 4), max_key_length=MAX_KEY_LENGTH, chunk_size=STREAM_CHUNK_SIZE
+) -> Counter:
+    analysis = StreamingKasiski(substring_lengths, max_key_length)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            analysis.update(chunk)
+    return analysis.get_possible_lengths()
@@ -0,0 +1,243 @@
+"""Recovery of a Vigenere key and plaintext, letters other than a..z are kept as they are."""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from src.kasiski_test import engine
+from src.kasiski_test.config import (
+    ALPHABET,
+    KASISKI_SUBSTRING_LENGTHS,
+    LETTER_FREQUENCIES,
+    MAX_KEY_LENGTH,
+    N_KEY_LENGTH_CANDIDATES,
+)
+
+N_LETTERS = len(ALPHABET)
+# shifted_letters[s, k] is the ciphertext letter of the plaintext letter k under the shift s
+SHIFTED_LETTERS = (np.arange(N_LETTERS)[None, :] + np.arange(N_LETTERS)[:, None]) % N_LETTERS
+
+
+class VigenereResult(NamedTuple):
+    key: str
+    plaintext: str
+    # (key length, score) from the best to the worst
+    key_length_ranking: List[Tuple[int, float]]
+    # (key, chi-squared statistic of its plaintext) for every recovered candidate length in the ranking order
+    candidate_keys: List[Tuple[str, float]]
+    friedman_key_length: float
+
+
+def get_frequencies(language) -> np.ndarray:
+    if language not in LETTER_FREQUENCIES:
+        raise ValueError(f"There are no letter frequencies for '{language}'.")
+    frequencies = np.array(LETTER_FREQUENCIES[language])
+    return frequencies / frequencies.sum()
+
+
+def to_letter_codes(text: str) -> np.ndarray:
+    """Codes 0..25 of the letters of text, other characters are dropped."""
+
+    characters = np.frombuffer(text.lower().encode("utf-32-le"), dtype=np.uint32)
+    is_letter = (characters >= ord(ALPHABET[0])) & (characters <= ord(ALPHABET[-1]))
+    return (characters[is_letter] - ord(ALPHABET[0])).astype(np.uint8)
+
+
+def get_column_counts(codes: np.ndarray, key_length) -> np.ndarray:
+    """(key_length, 26) letter counts of the columns of the padded (n_rows, key_length) matrix."""
+
+    n_rows = -(-len(codes) // key_length)
+    padded_codes = np.full(n_rows * key_length, N_LETTERS, dtype=np.int64)
+    padded_codes[: len(codes)] = codes
+    matrix = padded_codes.reshape(n_rows, key_length)
+    column_offsets = np.arange(key_length) * (N_LETTERS + 1)
+    counts = np.bincount((matrix + column_offsets).ravel(), minlength=key_length * (N_LETTERS + 1))
+    return counts.reshape(key_length, N_LETTERS + 1)[:, :N_LETTERS]
+
+
+def get_index_of_coincidence(counts: np.ndarray) -> np.ndarray:
+    """Index of coincidence of every row of counts."""
+
+    n_letters = counts.sum(axis=-1)
+    return (counts * (counts - 1)).sum(axis=-1) / np.maximum(n_letters * (n_letters - 1), 1)
+
+
+def get_friedman_key_length(codes: np.ndarray, frequencies: np.ndarray) -> float:
+    language_ic = float((frequencies ** 2).sum())
+    text_ic = float(get_index_of_coincidence(np.bincount(codes, minlength=N_LETTERS)))
+    if text_ic <= 1 / N_LETTERS:
+        return float("inf")
+    return (language_ic - 1 / N_LETTERS) / (text_ic - 1 / N_LETTERS)
+
+
+def rank_key_lengths(codes: np.ndarray, max_key_length, frequencies: np.ndarray) -> List[Tuple[int, float]]:
+    """The mean column index of coincidence (0 for random text, 1 for the language) times 1 + the Kasiski share."""
+
+    language_ic = float((frequencies ** 2).sum())
+    possible_lengths = engine.count_divisors(engine.get_distance_histograms(codes, KASISKI_SUBSTRING_LENGTHS))
+    n_repeats = possible_lengths[1]
+
+    ranking = []
+    for key_length in range(1, max_key_length + 1):
+        column_ic = get_index_of_coincidence(get_column_counts(codes, key_length)).mean()
+        ic_score = (column_ic - 1 / N_LETTERS) / (language_ic - 1 / N_LETTERS)
+        kasiski_share = possible_lengths[key_length] / n_repeats if n_repeats else 0.0
+        ranking.append((key_length, float(ic_score * (1 + kasiski_share))))
+    return sorted(ranking, key=lambda item: -item[1])
+
+
+def get_held_out_log_likelihood(codes: np.ndarray, key_length, frequencies: np.ndarray) -> float:
+    """Mean log-likelihood of the plaintext letters of even rows under the key fitted on odd rows and vice versa.
+
+    Unlike the column index of coincidence, it does not reward the extra freedom of multiples of the key length.
+    """
+
+    log_frequencies = np.log(frequencies)
+    is_even_row = np.arange(len(codes)) // key_length % 2 == 0
+    log_likelihood = 0.0
+    for fit_rows in (is_even_row, ~is_even_row):
+        # rows are whole, so the letters of the selected rows keep their columns
+        fit_counts = get_column_counts(codes[fit_rows], key_length)[:, SHIFTED_LETTERS]
+        test_counts = get_column_counts(codes[~fit_rows], key_length)[:, SHIFTED_LETTERS]
+        shifts = (fit_counts @ log_frequencies).argmax(axis=-1)
+        log_likelihood += float((test_counts[np.arange(key_length), shifts] @ log_frequencies).sum())
+    return log_likelihood / len(codes)
+
+
+def choose_key_length(codes: np.ndarray, candidates: List[int], frequencies: np.ndarray) -> int:
+    """The candidate dividing the best ranked length with the best held-out fit, the shortest one on a tie."""
+
+    divisors = sorted(key_length for key_length in candidates if candidates[0] % key_length == 0)
+    return max(divisors, key=lambda key_length: get_held_out_log_likelihood(codes, key_length, frequencies))
+
+
+def get_chi_squared(counts: np.ndarray, frequencies: np.ndarray) -> np.ndarray:
+    """(key_length, 26) chi-squared statistics of every column deciphered with every shift."""
+
+    expected = counts.sum(axis=-1)[:, None, None] * frequencies[None, None, :]
+    observed = counts[:, SHIFTED_LETTERS]
+    return ((observed - expected) ** 2 / np.maximum(expected, 1e-12)).sum(axis=-1)
+
+
+def get_shortest_period(shifts: np.ndarray) -> np.ndarray:
+    for period in range(1, len(shifts) + 1):
+        if len(shifts) % period == 0 and np.array_equal(shifts, np.tile(shifts[:period], len(shifts) // period)):
+            return shifts[:period]
+    return shifts
+
+
+def recover_key(codes: np.ndarray, key_length, frequencies: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Shifts of the key of key_length letters and the chi-squared statistic of the whole plaintext."""
+
+    counts = get_column_counts(codes, key_length)
+    shifts = get_shortest_period(get_chi_squared(counts, frequencies).argmin(axis=-1))
+    plaintext_counts = np.bincount(
+        (codes.astype(np.int64) - shifts[np.arange(len(codes)) % len(shifts)]) % N_LETTERS, minlength=N_LETTERS
+    )
+    return shifts, float(get_chi_squared(plaintext_counts[None, :], frequencies)[0, 0])
+
+
+def decrypt(text: str, key: str) -> str:
+    """Vigenere decryption of the letters of text, the case and other characters are kept."""
+
+    shifts = np.array([ALPHABET.index(letter) for letter in key.lower()], dtype=np.int64)
+    characters = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    is_lower = (characters >= ord("a")) & (characters <= ord("z"))
+    is_upper = (characters >= ord("A")) & (characters <= ord("Z"))
+    is_letter = is_lower | is_upper
+    first_letters = np.where(is_lower, ord("a"), ord("A"))[is_letter]
+
+    letter_shifts = shifts[np.arange(int(is_letter.sum())) % len(shifts)]
+    characters[is_letter] = (characters[is_letter] - first_letters - letter_shifts) % N_LETTERS + first_letters
+    return characters.astype(np.uint32).tobytes().decode("utf-32-le")
+
+
+def break_vigenere(
+    text: str,
+    max_key_length=MAX_KEY_LENGTH,
+    n_candidates=N_KEY_LENGTH_CANDIDATES,
+    language="english",
+    n_workers=None,
+) -> VigenereResult:
+    """Key lengths of the n_candidates best ranked lengths are recovered in a process pool if n_workers is set."""
+
+    frequencies = get_frequencies(language)
+    codes = to_letter_codes(text)
+    if len(codes) == 0:
+        raise ValueError("Text must contain letters.")
+
+    ranking = rank_key_lengths(codes, max(1, min(max_key_length, len(codes))), frequencies)
+    candidates = [key_length for key_length, _ in ranking[:n_candidates]]
+    recover = partial(recover_key, codes, frequencies=frequencies)
+    if n_workers is None or len(candidates) < 2:
+        keys = list(map(recover, candidates))
+    else:
+        with ProcessPoolExecutor(n_workers) as executor:
+            keys = list(executor.map(recover, candidates))
+
+    candidate_keys = [("".join(ALPHABET[shift] for shift in shifts), chi_squared) for shifts, chi_squared in keys]
+    key = candidate_keys[candidates.index(choose_key_length(codes, candidates, frequencies))][0]
+    return VigenereResult(
+        key, decrypt(text, key), ranking, candidate_keys, get_friedman_key_length(codes, frequencies)
+    )
+
+
+def break_vigenere_file(path, **kwargs) -> Union[VigenereResult, str]:
+    """VigenereResult of the file text, or the error message for a file that cannot be analysed."""
+
+    try:
+        with open(path, "r") as f:
+            return break_vigenere(f.read(), **kwargs)
+    except OSError as error:
+        return error.strerror
+    except (UnicodeDecodeError, ValueError) as error:
+        return str(error)
+
+
+def break_vigenere_files(
+    paths: Iterable[str], n_workers=None, **kwargs
+) -> Iterator[Tuple[str, Union[VigenereResult, str]]]:
+    """Yields (path, break_vigenere_file(path)) in the order of paths, in a process pool if n_workers is set."""
+
+    paths = list(paths)
+    if n_workers is None or len(paths) < 2:
+        for path in paths:
+            yield path, break_vigenere_file(path, **kwargs)
+        return
+    with ProcessPoolExecutor(n_workers) as executor:
+        yield from zip(paths, executor.map(partial(break_vigenere_file, **kwargs), paths))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recover Vigenere keys and plaintexts of ciphertext files.")
+    parser.add_argument("paths", nargs="+", help="files with ciphertexts")
+    parser.add_argument("--max-key-length", type=int, default=MAX_KEY_LENGTH, help="longest key length tried")
+    parser.add_argument("--candidates", type=int, default=N_KEY_LENGTH_CANDIDATES, help="key lengths recovered")
+    parser.add_argument("--language", default="english", choices=sorted(LETTER_FREQUENCIES), help="plaintext language")
+    parser.add_argument("--workers", type=int, default=None, help="analyse files in a process pool")
+    args = parser.parse_args(argv)
+
+    is_successful = True
+    results = break_vigenere_files(
+        args.paths,
+        args.workers,
+        max_key_length=args.max_key_length,
+        n_candidates=args.candidates,
+        language=args.language,
+    )
+    for path, result in results:
+        if isinstance(result, str):
+            print(f"{path}: {result}", file=sys.stderr)
+            is_successful = False
+            continue
+        print(f"{path}: key '{result.key}', Friedman key length estimate {result.friedman_key_length:.1f}")
+        print(result.plaintext)
+    return 0 if is_successful else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
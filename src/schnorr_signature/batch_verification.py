@@ -0,0 +1,59 @@
+"""Verification of many signatures under the same domain parameters."""
+
+from collections import defaultdict
+from typing import List, Sequence, Tuple
+
+from src.schnorr_signature.hashing import digest_to_challenge, get_challenge, get_challenge_input
+from src.schnorr_signature.precomputation import PUBLIC_KEY_TABLES, pow_g
+from src.sha256.vectorized import sha256_equal_length
+
+# smaller groups of challenges with the same input length are hashed one by one
+MIN_CHALLENGES_FOR_VECTORIZATION = 16
+
+
+def get_public_key_powers(signatures, public_keys, domain_params) -> List[int]:
+    """y^e mod p for every signature through the public key tables shared with single verification."""
+
+    exponents = [signature[0] % domain_params["q"] for signature in signatures]
+    return PUBLIC_KEY_TABLES.pow_many(public_keys, exponents, domain_params)
+
+
+def get_challenges(messages, commitments, domain_params) -> List[int]:
+    """get_challenge for every pair, inputs of the same length are hashed lane-parallel."""
+
+    indexes_by_length = defaultdict(list)
+    inputs = [get_challenge_input(message, r, domain_params) for message, r in zip(messages, commitments)]
+    for i, challenge_input in enumerate(inputs):
+        indexes_by_length[len(challenge_input)].append(i)
+
+    challenges = [None] * len(inputs)
+    for indexes in indexes_by_length.values():
+        if len(indexes) < MIN_CHALLENGES_FOR_VECTORIZATION:
+            for i in indexes:
+                challenges[i] = get_challenge(messages[i], commitments[i], domain_params)
+            continue
+        digests = sha256_equal_length([inputs[i] for i in indexes])
+        for i, digest in zip(indexes, digests):
+            challenges[i] = digest_to_challenge(digest.tobytes(), domain_params)
+    return challenges
+
+
+def verify_batch(
+    messages: Sequence[str], signatures: Sequence[Tuple[int, int]], public_keys: Sequence[int], domain_params
+) -> List[bool]:
+    """Returns whether every signature is correct, all(...) of the result checks the whole batch."""
+
+    if not len(messages) == len(signatures) == len(public_keys):
+        raise ValueError("Every message must have exactly one signature and one public key.")
+    public_key_powers = get_public_key_powers(signatures, public_keys, domain_params)
+    commitments = [
+        pow_g(signature[1], domain_params) * y_power % domain_params["p"]
+        for signature, y_power in zip(signatures, public_key_powers)
+    ]
+    challenges = get_challenges(messages, commitments, domain_params)
+    return [signature[0] == challenge for signature, challenge in zip(signatures, challenges)]
+
+
+def find_incorrect_signatures(messages, signatures, public_keys, domain_params) -> List[int]:
+    results = verify_batch(messages, signatures, public_keys, domain_params)
+    return [i for i, is_correct in enumerate(results) if not is_correct]
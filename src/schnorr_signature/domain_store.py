@@ -0,0 +1,115 @@
+"""SQLite store of domain parameters with their validation results and fixed-base table files."""
+
+import os
+import sqlite3
+from random import randint
+from typing import List, Optional, Tuple
+
+from src.schnorr_signature.config import PRIME_CONSTANTS
+from src.schnorr_signature.generation import generate_prime_numbers
+from src.schnorr_signature.main import get_generator, are_domain_parameters_valid
+from src.schnorr_signature.precomputation import get_fixed_base_table, FIXED_BASE_TABLE_PATHS
+
+CREATE_DOMAINS_TABLE = """
+CREATE TABLE IF NOT EXISTS domains (
+    id INTEGER PRIMARY KEY,
+    p TEXT NOT NULL,
+    q TEXT NOT NULL,
+    g TEXT NOT NULL,
+    seed INTEGER,
+    counter INTEGER,
+    is_valid INTEGER NOT NULL,
+    UNIQUE (p, q, g)
+)
+"""
+
+
+class DomainStore:
+    def __init__(self, path):
+        self.path = path
+        self.tables_directory = f"{path}.tables"
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(CREATE_DOMAINS_TABLE)
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_table_path(self, domain_id):
+        return os.path.join(self.tables_directory, f"{domain_id}.table")
+
+    def add(self, domain_params, seed=None, counter=None) -> int:
+        """Validates and stores the domain once, returns its id."""
+
+        p, q, g = domain_params["p"], domain_params["q"], domain_params["g"]
+        row = self.connection.execute(
+            "SELECT id FROM domains WHERE p = ? AND q = ? AND g = ?", (hex(p), hex(q), hex(g))
+        ).fetchone()
+        if row is not None:
+            return row[0]
+
+        is_valid = are_domain_parameters_valid(domain_params)
+        with self.connection:
+            domain_id = self.connection.execute(
+                "INSERT INTO domains (p, q, g, seed, counter, is_valid) VALUES (?, ?, ?, ?, ?, ?)",
+                (hex(p), hex(q), hex(g), seed, counter, int(is_valid)),
+            ).lastrowid
+        if is_valid:
+            os.makedirs(self.tables_directory, exist_ok=True)
+            get_fixed_base_table({"p": p, "q": q, "g": g}, self.get_table_path(domain_id))
+        return domain_id
+
+    def generate(self, use_ready_made_numbers=True, n_workers=None) -> int:
+        """Stores a new domain with one of PRIME_CONSTANTS or freshly generated primes."""
+
+        if use_ready_made_numbers:
+            p, q = PRIME_CONSTANTS[randint(0, len(PRIME_CONSTANTS) - 1)]
+            seed = counter = None
+        else:
+            p, q, seed, counter = generate_prime_numbers(n_workers)
+        return self.add({"p": p, "q": q, "g": get_generator(p, q)}, seed, counter)
+
+    def get_row(self, domain_id):
+        row = self.connection.execute(
+            "SELECT p, q, g, seed, counter, is_valid FROM domains WHERE id = ?", (domain_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"There is no domain {domain_id} in '{self.path}'.")
+        return row
+
+    def get(self, domain_id):
+        """Domain parameters p, q and g, ValueError for a domain that failed validation."""
+
+        p, q, g, _, _, is_valid = self.get_row(domain_id)
+        if not is_valid:
+            raise ValueError(f"Domain {domain_id} in '{self.path}' failed validation.")
+
+        domain_params = {"p": int(p, 16), "q": int(q, 16), "g": int(g, 16)}
+        FIXED_BASE_TABLE_PATHS[(domain_params["p"], domain_params["q"], domain_params["g"])] = self.get_table_path(
+            domain_id
+        )
+        return domain_params
+
+    def get_generation(self, domain_id) -> Tuple[Optional[int], Optional[int]]:
+        """Seed and counter of generated primes, None for PRIME_CONSTANTS and imported domains."""
+
+        _, _, _, seed, counter, _ = self.get_row(domain_id)
+        return seed, counter
+
+    def get_ids(self, only_valid=True) -> List[int]:
+        query = "SELECT id FROM domains" + (" WHERE is_valid = 1" if only_valid else "") + " ORDER BY id"
+        return [row[0] for row in self.connection.execute(query)]
+
+    def get_default(self, use_ready_made_numbers=True):
+        """The first valid domain of the store, a new one is generated for an empty store."""
+
+        domain_ids = self.get_ids()
+        domain_id = domain_ids[0] if domain_ids else self.generate(use_ready_made_numbers)
+        return self.get(domain_id)
@@ -0,0 +1,89 @@
+"""Generation of Schnorr primes q (256 bits) and p (2048 bits) with q | p - 1 from a seed and a counter."""
+
+from concurrent.futures import ProcessPoolExecutor
+from random import randint
+from typing import Optional, Tuple
+
+from src.schnorr_signature.primality import is_prime
+from src.schnorr_signature.utils import int2sha_bin, bin_str2int
+
+Q_BIT_LENGTH = 256
+P_BIT_LENGTH = 2048
+Q_MODULO = 2 ** Q_BIT_LENGTH
+TWO_POW_L_MINUS_1 = 2 ** (P_BIT_LENGTH - 1)
+N_HASHES = 7
+LAST_HASH_BIT_LENGTH = 255
+FIRST_OFFSET = 2
+MAX_COUNTER = 4096
+COUNTERS_IN_TASK = 64
+
+
+def int2sha_int(number):
+    return bin_str2int(int2sha_bin(number))
+
+
+def get_q_candidate(seed):
+    u = int2sha_int(seed) ^ int2sha_int((seed + 1) % Q_MODULO)
+    return u | (1 << (Q_BIT_LENGTH - 1)) | 1
+
+
+def get_p_candidate(seed, q, counter):
+    offset = FIRST_OFFSET + counter * (N_HASHES + 1)
+    v = [int2sha_int((seed + offset + k) % Q_MODULO) for k in range(N_HASHES + 1)]
+    w = v[0]
+    for i in range(1, N_HASHES):
+        w += v[i] << (Q_BIT_LENGTH + i)
+    w += (v[N_HASHES] % 2 ** LAST_HASH_BIT_LENGTH) << (Q_BIT_LENGTH + N_HASHES)
+    x = w + TWO_POW_L_MINUS_1
+    return x - x % (2 * q) + 1
+
+
+def find_p_in_range(seed, q, counters) -> Optional[Tuple[int, int]]:
+    """(counter, p) for the first prime candidate among counters, None if there is none."""
+
+    for counter in counters:
+        p = get_p_candidate(seed, q, counter)
+        if p > TWO_POW_L_MINUS_1 and is_prime(p):
+            return counter, p
+    return None
+
+
+def find_p(seed, q, executor: ProcessPoolExecutor = None) -> Optional[Tuple[int, int]]:
+    tasks = [range(i, min(i + COUNTERS_IN_TASK, MAX_COUNTER)) for i in range(0, MAX_COUNTER, COUNTERS_IN_TASK)]
+    if executor is None:
+        for counters in tasks:
+            result = find_p_in_range(seed, q, counters)
+            if result is not None:
+                return result
+        return None
+
+    futures = [executor.submit(find_p_in_range, seed, q, counters) for counters in tasks]
+    try:
+        # Waiting in counter order keeps the smallest prime counter even if a later task finishes first.
+        for future in futures:
+            result = future.result()
+            if result is not None:
+                return result
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def generate_prime_numbers(n_workers=None) -> Tuple[int, int, int, int]:
+    """Returns (p, q, seed, counter), n_workers enables the process pool for the p search."""
+
+    executor = None if n_workers is None else ProcessPoolExecutor(n_workers)
+    try:
+        while True:
+            seed = randint(2, 2 ** 32)
+            q = get_q_candidate(seed)
+            if not is_prime(q):
+                continue
+            result = find_p(seed, q, executor)
+            if result is not None:
+                counter, p = result
+                return p, q, seed, counter
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
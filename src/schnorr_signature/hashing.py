@@ -0,0 +1,52 @@
+"""The challenge e = SHA-256(UTF-8 message || r as len(p) bytes) mod q with cached message midstates."""
+
+import hashlib
+from collections import OrderedDict
+
+from src.sha256.hasher import SHA256
+
+MESSAGE_HASHERS_CACHE_SIZE = 256
+
+# key is a digest of the message, so long messages themselves are not kept
+MESSAGE_HASHERS = OrderedDict()
+
+
+def to_message_bytes(message) -> bytes:
+    return message.encode() if isinstance(message, str) else bytes(message)
+
+
+def get_message_hasher(message: bytes) -> SHA256:
+    """A hasher that has absorbed message, shared with later calls, so it must be copied before an update."""
+
+    key = (len(message), hashlib.sha256(message).digest())
+    if key in MESSAGE_HASHERS:
+        MESSAGE_HASHERS.move_to_end(key)
+        return MESSAGE_HASHERS[key]
+
+    hasher = SHA256(message)
+    MESSAGE_HASHERS[key] = hasher
+    if len(MESSAGE_HASHERS) > MESSAGE_HASHERS_CACHE_SIZE:
+        MESSAGE_HASHERS.popitem(last=False)
+    return hasher
+
+
+def to_commitment_bytes(r, domain_params) -> bytes:
+    return r.to_bytes((domain_params["p"].bit_length() + 7) // 8, "big")
+
+
+def get_challenge_input(message, r, domain_params) -> bytes:
+    return to_message_bytes(message) + to_commitment_bytes(r, domain_params)
+
+
+def digest_to_challenge(digest: bytes, domain_params):
+    return int.from_bytes(digest, "big") % domain_params["q"]
+
+
+def get_challenge(message, r, domain_params):
+    hasher = get_message_hasher(to_message_bytes(message)).copy()
+    hasher.update(to_commitment_bytes(r, domain_params))
+    return digest_to_challenge(hasher.digest(), domain_params)
+
+
+def clear_message_hashers_cache():
+    MESSAGE_HASHERS.clear()
@@ -1,144 +1,82 @@
 from random import randint
 from typing import Tuple
 
-from bitarray import bitarray
-from bitarray.util import ba2int
-
 from src.schnorr_signature.config import PRIME_CONSTANTS
-from src.schnorr_signature.utils import int2sha_bin, bin_str2int, int2hex_str
-from src.sha256.main import sha256
-from src.utils.encodings_processing import number_to_binary_str, to_binary, binary_to_hex
-
-
-def get_number_representation(number):
-    """An auxiliary function for Miller-Rabin test."""
-
-    number = number - 1
-    a = 1
-    two_power = 2
-    while number % two_power == 0:
-        a += 1
-        two_power *= 2
-    a -= 1
-    m = number // (two_power // 2)
-    return a, m
-
-
-def is_prime(n, k=60):
-    """A probabilistic primality Miller-Rabin test."""
-
-    from random import randint
-
-    if n < 2:
-        return False
-    for p in [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]:
-        if n % p == 0:
-            return n == p
-    s, d = get_number_representation(n)
-    for i in range(k):
-        x = pow(randint(2, n - 1), d, n)
-        if x == 1 or x == n - 1:
-            continue
-        for r in range(1, s):
-            x = pow(x, 2, n)
-            if x == 1:
-                return False
-            if x == n - 1:
-                break
-        else:
-            return False
-    return True
-
-
-def get_prime_numbers():
-    hash_bit_count = 256
-    L = 2048
-    max_q_modulo = 2 ** hash_bit_count
-    two_pow_L_minus_1 = 2 ** (L - 1)
-
-    zeros = "0" * 255
-    seed = None
-    almost_max_q_modulo = bitarray("1" + zeros)
-    one_expanded = bitarray(zeros + "1")
-
-    offset = 2
-    n = 7
-    two_powers = [2 ** i for i in range(n + 1)]
-    b = 255
-
-    p = None
-    q = None
-
-    while p is None:
-        q = None
-        while q is None or not is_prime(ba2int(q)):
-            seed = randint(2, 2 ** 32)
-
-            u = bitarray(int2sha_bin(seed)) ^ bitarray(int2sha_bin((seed + 1) % max_q_modulo))
-            q = u | almost_max_q_modulo | one_expanded
-
-        for counter in range(0, 4096):
-            v = []
-            for k in range(n + 1):
-                bin_v = int2sha_bin((seed + offset + k) % max_q_modulo)
-                v.append(bin_str2int(bin_v))
-            w = v[0]
-            for i, v_i in enumerate(v[1:-1]):
-                w += v_i * max_q_modulo * two_powers[i + 1]
-
-            w += (v[n] % (2 ** b)) * max_q_modulo * two_powers[n]
-
-            x = w + two_pow_L_minus_1
-            c = x % (2 * ba2int(q))
-            p_candidate = x - c + 1
-            if p_candidate > two_pow_L_minus_1 and is_prime(p_candidate):
-                p = p_candidate
-                break
-            offset += n + 1
-    return p, ba2int(q)
-
-
-def get_domain_parameters(use_ready_made_numbers=True):
+from src.schnorr_signature.generation import generate_prime_numbers
+from src.schnorr_signature.hashing import get_challenge
+from src.schnorr_signature.precomputation import pow_g, PUBLIC_KEY_TABLES
+from src.schnorr_signature.primality import is_prime, BAILLIE_PSW
+from src.schnorr_signature.utils import int2hex_str
+
+
+def get_prime_numbers(n_workers=None):
+    p, q, seed, counter = generate_prime_numbers(n_workers)
+    return p, q
+
+
+def get_domain_parameters(use_ready_made_numbers=True, store=None):
     """q ~ 2^256, g ~ 2^2048"""
 
+    if store is not None:
+        return store.get_default(use_ready_made_numbers)
     if use_ready_made_numbers:
         p, q = PRIME_CONSTANTS[randint(0, len(PRIME_CONSTANTS) - 1)]
     else:
         p, q = get_prime_numbers()
+    return {"p": p, "q": q, "g": get_generator(p, q)}
+
+
+def get_generator(p, q):
+    """A random generator of the subgroup of order q."""
 
     g = None
     k = (p - 1) // q
     while g is None or g == 1:
         h = randint(1, p - 1)
         g = pow(h, k, p)
+    return g
 
-    return {"p": p, "q": q, "g": g}
+
+def are_domain_parameters_valid(domain_params):
+    """Checks imported parameters: p and q are prime, q | p - 1 and g generates the subgroup of order q."""
+
+    p, q, g = domain_params["p"], domain_params["q"], domain_params["g"]
+    return (
+        (p - 1) % q == 0
+        and 1 < g < p
+        and pow(g, q, p) == 1
+        and is_prime(q, method=BAILLIE_PSW)
+        and is_prime(p, method=BAILLIE_PSW)
+    )
 
 
 def generate_keys(domain_params):
     private_key = randint(1, domain_params["q"] - 1)
-    public_key = pow(domain_params["g"], domain_params["q"] - private_key, domain_params["p"])
+    public_key = pow_g(domain_params["q"] - private_key, domain_params)
     return private_key, public_key
 
 
 def get_first_sign_part(message, r, domain_params):
-    return int(sha256(to_binary(message) + number_to_binary_str(r)), 2) % domain_params["q"]
+    return get_challenge(message, r, domain_params)
 
 
 def sign(message, domain_params, private_key):
     k = randint(1, domain_params["q"] - 1)
-    r = pow(domain_params["g"], k, domain_params["p"])
+    r = pow_g(k, domain_params)
     first_signature_part = get_first_sign_part(message, r, domain_params)
     second_signature_part = (k + private_key * first_signature_part) % domain_params["q"]
     return first_signature_part, second_signature_part
 
 
+def get_commitment(signature: Tuple[int, int], public_key, domain_params):
+    """r = g^s * y^e mod p with the exponents reduced modulo q."""
+
+    y_power = PUBLIC_KEY_TABLES.pow(public_key, signature[0] % domain_params["q"], domain_params)
+    return pow_g(signature[1], domain_params) * y_power % domain_params["p"]
+
+
 def is_signature_correct(message, signature: Tuple[int, int], public_key, domain_params):
-    r = (
-        pow(domain_params["g"], signature[1], domain_params["p"])
-        * pow(public_key, signature[0], domain_params["p"])
-        % domain_params["p"]
-    )
+    r = get_commitment(signature, public_key, domain_params)
     return signature[0] == get_first_sign_part(message, r, domain_params)
 
 
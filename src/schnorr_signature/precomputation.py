@@ -0,0 +1,217 @@
+"""Fixed-base exponentiation with tables of b^(d * 2^(w * i)) for every window i and digit d."""
+
+import json
+import sys
+from collections import Counter, OrderedDict
+from typing import List
+
+FIXED_BASE_WINDOW_SIZE = 8
+# number of domains whose generator table is kept in memory
+FIXED_BASE_TABLE_CACHE_SIZE = 8
+
+# public key tables are smaller (about 0.5 MB for 2048/256 parameters) since many of them are cached
+PUBLIC_KEY_WINDOW_SIZE = 5
+PUBLIC_KEY_TABLE_CACHE_SIZE = 32
+# a public key gets a table once it has been used this many times
+PUBLIC_KEY_TABLE_THRESHOLD = 8
+# number of public keys whose uses are counted before they get a table
+PUBLIC_KEY_COUNTER_SIZE = 4096
+
+
+class FixedBaseTable:
+    def __init__(self, base, modulus, exponent_bit_length, window_size=FIXED_BASE_WINDOW_SIZE, rows=None):
+        self.base = base % modulus
+        self.modulus = modulus
+        self.window_size = window_size
+        self.n_windows = -(-exponent_bit_length // window_size)
+        self.rows = self.build_rows() if rows is None else rows
+
+    def build_rows(self):
+        rows = []
+        window_base = self.base
+        for _ in range(self.n_windows):
+            row = [1 % self.modulus, window_base]
+            for _ in range(2, 2 ** self.window_size):
+                row.append(row[-1] * window_base % self.modulus)
+            rows.append(row)
+            window_base = row[-1] * window_base % self.modulus
+        return rows
+
+    def pow(self, exponent):
+        """base^exponent modulo modulus, exponents longer than the table fall back to pow()."""
+
+        if exponent < 0 or exponent.bit_length() > self.n_windows * self.window_size:
+            return pow(self.base, exponent, self.modulus)
+        mask = 2 ** self.window_size - 1
+        result = 1
+        for row in self.rows:
+            if exponent == 0:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % self.modulus
+            exponent >>= self.window_size
+        return result % self.modulus
+
+    def memory_usage(self):
+        """Approximate size of the table in bytes."""
+
+        return sum(sys.getsizeof(row) + sum(sys.getsizeof(entry) for entry in row) for row in self.rows)
+
+    def save(self, path):
+        """A JSON header line followed by the table entries as fixed-width big-endian numbers."""
+
+        entry_length = (self.modulus.bit_length() + 7) // 8
+        header = {
+            "base": hex(self.base),
+            "modulus": hex(self.modulus),
+            "window_size": self.window_size,
+            "n_windows": self.n_windows,
+            "entry_length": entry_length,
+        }
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            for row in self.rows:
+                f.write(b"".join(entry.to_bytes(entry_length, "big") for entry in row))
+
+    @classmethod
+    def load(cls, path) -> "FixedBaseTable":
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            entry_length = header["entry_length"]
+            row_length = 2 ** header["window_size"]
+            rows = []
+            for _ in range(header["n_windows"]):
+                data = f.read(entry_length * row_length)
+                if len(data) != entry_length * row_length:
+                    raise ValueError(f"Fixed-base table file '{path}' is truncated.")
+                rows.append(
+                    [int.from_bytes(data[i : i + entry_length], "big") for i in range(0, len(data), entry_length)]
+                )
+        return cls(
+            int(header["base"], 16),
+            int(header["modulus"], 16),
+            header["n_windows"] * header["window_size"],
+            header["window_size"],
+            rows,
+        )
+
+
+FIXED_BASE_TABLES = OrderedDict()
+# files of the tables of known domains (see domain_store.py), loaded on the first use of a domain
+FIXED_BASE_TABLE_PATHS = {}
+
+
+def get_fixed_base_table(domain_params, path=None) -> FixedBaseTable:
+    """The LRU-cached table of g, loaded from or saved to path (or its registered path) when one is known."""
+
+    key = (domain_params["p"], domain_params["q"], domain_params["g"])
+    if key in FIXED_BASE_TABLES:
+        FIXED_BASE_TABLES.move_to_end(key)
+        return FIXED_BASE_TABLES[key]
+
+    if path is None:
+        path = FIXED_BASE_TABLE_PATHS.get(key)
+
+    table = None
+    if path is not None:
+        try:
+            table = FixedBaseTable.load(path)
+        except (OSError, ValueError):
+            table = None
+    exponent_bit_length = domain_params["q"].bit_length()
+    if (
+        table is None
+        or table.base != domain_params["g"]
+        or table.modulus != domain_params["p"]
+        or table.n_windows * table.window_size < exponent_bit_length
+    ):
+        table = FixedBaseTable(domain_params["g"], domain_params["p"], exponent_bit_length)
+        if path is not None:
+            table.save(path)
+
+    FIXED_BASE_TABLES[key] = table
+    if len(FIXED_BASE_TABLES) > FIXED_BASE_TABLE_CACHE_SIZE:
+        FIXED_BASE_TABLES.popitem(last=False)
+    return table
+
+
+class PublicKeyTableCache:
+    """LRU cache of fixed-base tables of public keys used at least threshold times."""
+
+    def __init__(
+        self,
+        max_size=PUBLIC_KEY_TABLE_CACHE_SIZE,
+        threshold=PUBLIC_KEY_TABLE_THRESHOLD,
+        window_size=PUBLIC_KEY_WINDOW_SIZE,
+        counter_size=PUBLIC_KEY_COUNTER_SIZE,
+    ):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.window_size = window_size
+        self.counter_size = counter_size
+        self.tables = OrderedDict()
+        self.use_counts = OrderedDict()
+        self.memory_usage = 0
+        self.hits = 0
+        self.misses = 0
+
+    def pow(self, public_key, exponent, domain_params):
+        """public_key^exponent mod p, exponent must be reduced modulo q."""
+
+        key = (domain_params["p"], public_key)
+        if key in self.tables:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return self.tables[key].pow(exponent)
+
+        self.misses += 1
+        use_count = self.use_counts.pop(key, 0) + 1
+        if use_count < self.threshold:
+            self.use_counts[key] = use_count
+            if len(self.use_counts) > self.counter_size:
+                self.use_counts.popitem(last=False)
+            return pow(public_key, exponent, domain_params["p"])
+
+        table = FixedBaseTable(public_key, domain_params["p"], domain_params["q"].bit_length(), self.window_size)
+        self.tables[key] = table
+        self.memory_usage += table.memory_usage()
+        if len(self.tables) > self.max_size:
+            self.memory_usage -= self.tables.popitem(last=False)[1].memory_usage()
+        return table.pow(exponent)
+
+    def pow_many(self, public_keys, exponents, domain_params) -> List[int]:
+        """pow for every pair, a key used threshold times in total with this batch gets its table on its first use."""
+
+        for public_key, n_uses in Counter(public_keys).items():
+            key = (domain_params["p"], public_key)
+            if key not in self.tables and self.use_counts.get(key, 0) + n_uses >= self.threshold:
+                self.use_counts[key] = self.threshold - 1
+                self.use_counts.move_to_end(key)
+        return [self.pow(public_key, exponent, domain_params) for public_key, exponent in zip(public_keys, exponents)]
+
+    def get_stats(self):
+        n_uses = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / n_uses if n_uses else 0.0,
+            "n_tables": len(self.tables),
+            "memory_usage": self.memory_usage,
+        }
+
+    def clear(self):
+        self.tables.clear()
+        self.use_counts.clear()
+        self.memory_usage = 0
+        self.hits = 0
+        self.misses = 0
+
+
+PUBLIC_KEY_TABLES = PublicKeyTableCache()
+
+
+def pow_g(exponent, domain_params):
+    """g^exponent mod p. g has order q, so the exponent is reduced modulo q first."""
+
+    return get_fixed_base_table(domain_params).pow(exponent % domain_params["q"])
@@ -0,0 +1,160 @@
+"""Primality tests: a small-prime gcd sieve, then Miller-Rabin or Baillie-PSW."""
+
+from functools import lru_cache
+from math import gcd, isqrt, prod
+from random import Random, SystemRandom
+
+SMALL_PRIMES_LIMIT = 20000
+# every product has about 1800 bits, so a gcd with a 2048-bit number is cheap and common factors are found first
+SMALL_PRIMES_IN_PRODUCT = 128
+
+# Miller-Rabin with these bases is exact below DETERMINISTIC_LIMIT (Sorenson and Webster, 2015)
+DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+BAILLIE_PSW = "baillie_psw"
+MILLER_RABIN = "miller_rabin"
+MILLER_RABIN_ROUNDS = 40
+WITNESSES_SEED = 0
+WITNESS_BIT_LENGTH = 64
+
+
+def get_primes_below(limit):
+    """Sieve of Eratosthenes."""
+
+    is_prime_flags = bytearray([1]) * limit
+    is_prime_flags[: min(limit, 2)] = bytes(min(limit, 2))
+    for i in range(2, int(limit ** 0.5) + 1):
+        if is_prime_flags[i]:
+            is_prime_flags[i * i :: i] = bytes(len(range(i * i, limit, i)))
+    return tuple(i for i, flag in enumerate(is_prime_flags) if flag)
+
+
+SMALL_PRIMES = get_primes_below(SMALL_PRIMES_LIMIT)
+SMALL_PRIMES_SET = frozenset(SMALL_PRIMES)
+SMALL_PRIMES_PRODUCTS = tuple(
+    prod(SMALL_PRIMES[i : i + SMALL_PRIMES_IN_PRODUCT]) for i in range(0, len(SMALL_PRIMES), SMALL_PRIMES_IN_PRODUCT)
+)
+
+
+def has_small_factor(n):
+    """Whether n > SMALL_PRIMES_LIMIT has a prime factor below SMALL_PRIMES_LIMIT."""
+
+    return any(gcd(n, primes_product) != 1 for primes_product in SMALL_PRIMES_PRODUCTS)
+
+
+def get_number_representation(number):
+    """An auxiliary function for Miller-Rabin test: number - 1 = 2^a * m with an odd m."""
+
+    number = number - 1
+    a = (number & -number).bit_length() - 1
+    return a, number >> a
+
+
+def is_strong_probable_prime(n, base, s, d):
+    """One Miller-Rabin round, n - 1 = 2^s * d."""
+
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(1, s):
+        x = x * x % n
+        if x == n - 1:
+            return True
+        if x == 1:
+            return False
+    return False
+
+
+@lru_cache(maxsize=16)
+def get_witnesses(k, seed):
+    """k Miller-Rabin witnesses from a generator seeded with seed, the same for every candidate."""
+
+    generator = Random(seed)
+    return tuple(generator.randrange(2, 2 ** WITNESS_BIT_LENGTH) for _ in range(k))
+
+
+def jacobi_symbol(a, n):
+    """(a / n) for an odd positive n."""
+
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def get_lucas_parameter(n):
+    """The first D of 5, -7, 9, -11, ... with (D / n) = -1 (Selfridge's method A), None if n is composite."""
+
+    if isqrt(n) ** 2 == n:
+        return None
+    d = 5
+    while True:
+        symbol = jacobi_symbol(d, n)
+        if symbol == -1:
+            return d
+        if symbol == 0 and abs(d) != n:
+            return None
+        d = -d - 2 if d > 0 else -d + 2
+
+
+def is_strong_lucas_probable_prime(n):
+    """Strong Lucas test with P = 1 and Q = (1 - D) / 4 for an odd n."""
+
+    d_parameter = get_lucas_parameter(n)
+    if d_parameter is None:
+        return False
+    q_parameter = (1 - d_parameter) // 4
+    s, d = get_number_representation(n + 2)  # n + 1 = 2^s * d
+
+    # U_k, V_k and Q^k for k running over the prefixes of d in binary
+    u, v, q_power = 1, 1, q_parameter % n
+    for bit in bin(d)[3:]:
+        u = u * v % n
+        v = (v * v - 2 * q_power) % n
+        q_power = q_power * q_power % n
+        if bit == "1":
+            u, v = u + v, d_parameter * u + v
+            u = (u + n if u % 2 else u) // 2 % n
+            v = (v + n if v % 2 else v) // 2 % n
+            q_power = q_power * q_parameter % n
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(1, s):
+        v = (v * v - 2 * q_power) % n
+        if v == 0:
+            return True
+        q_power = q_power * q_power % n
+    return False
+
+
+def is_prime(n, k=MILLER_RABIN_ROUNDS, method=BAILLIE_PSW, seed=WITNESSES_SEED):
+    """Exact below DETERMINISTIC_LIMIT, method above it, seed=None draws fresh Miller-Rabin witnesses."""
+
+    if n <= SMALL_PRIMES[-1]:
+        return n in SMALL_PRIMES_SET
+    if has_small_factor(n):
+        return False
+
+    s, d = get_number_representation(n)
+    if n < DETERMINISTIC_LIMIT:
+        return all(is_strong_probable_prime(n, base, s, d) for base in DETERMINISTIC_BASES)
+    if method == BAILLIE_PSW:
+        return is_strong_probable_prime(n, 2, s, d) and is_strong_lucas_probable_prime(n)
+    if method == MILLER_RABIN:
+        if seed is None:
+            generator = SystemRandom()
+            witnesses = (generator.randrange(2, n - 1) for _ in range(k))
+        else:
+            witnesses = get_witnesses(k, seed)
+        return all(is_strong_probable_prime(n, base, s, d) for base in witnesses)
+    raise ValueError(f"Unknown primality test '{method}'.")
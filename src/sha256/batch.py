@@ -0,0 +1,56 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
+
+from src.sha256.hasher import sha256_bytes
+
+MESSAGES_IN_TASK = 256
+MIN_MESSAGES_FOR_POOL = 4 * MESSAGES_IN_TASK
+
+
+def hash_messages(messages: List[bytes]) -> List[bytes]:
+    return [sha256_bytes(message) for message in messages]
+
+
+def chunk_iterable(iterable, chunk_length):
+    iterator = iter(iterable)
+    chunk = [bytes(item) for item in islice(iterator, chunk_length)]
+    while chunk:
+        yield chunk
+        chunk = [bytes(item) for item in islice(iterator, chunk_length)]
+
+
+def sha256_many(
+    messages: Iterable[bytes],
+    n_workers=None,
+    executor: ProcessPoolExecutor = None,
+    messages_in_task=MESSAGES_IN_TASK,
+    min_messages_for_pool=MIN_MESSAGES_FOR_POOL,
+    max_pending_tasks=None,
+) -> Iterator[bytes]:
+    """Yields the digests of messages in their order, hashing them in tasks of messages_in_task in a process pool."""
+
+    messages = iter(messages)
+    first_messages = list(islice(messages, min_messages_for_pool))
+    if len(first_messages) < min_messages_for_pool:
+        yield from map(sha256_bytes, first_messages)
+        return
+
+    if max_pending_tasks is None:
+        max_pending_tasks = 2 * (n_workers or os.cpu_count() or 1)
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(n_workers)
+    try:
+        pending_tasks = deque()
+        for task in chunk_iterable(chain(first_messages, messages), messages_in_task):
+            pending_tasks.append(executor.submit(hash_messages, task))
+            if len(pending_tasks) >= max_pending_tasks:
+                yield from pending_tasks.popleft().result()
+        while pending_tasks:
+            yield from pending_tasks.popleft().result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
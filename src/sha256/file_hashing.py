@@ -0,0 +1,149 @@
+"""sha256sum-compatible file hashing: python -m src.sha256.file_hashing [--check] FILE..."""
+
+import argparse
+import mmap
+import os
+import sys
+from contextlib import nullcontext
+
+from src.sha256.hasher import SHA256
+
+CHUNK_SIZE = 1 << 20
+STDIN_PATH = "-"
+ESCAPED_CHARACTERS = {"\\": "\\\\", "\n": "\\n", "\r": "\\r"}
+UNESCAPED_CHARACTERS = {escaped: character for character, escaped in ESCAPED_CHARACTERS.items()}
+
+
+def hash_stream(stream, chunk_size=CHUNK_SIZE) -> SHA256:
+    hasher = SHA256()
+    chunk = stream.read(chunk_size)
+    while chunk:
+        hasher.update(chunk)
+        chunk = stream.read(chunk_size)
+    return hasher
+
+
+def hash_file(path, chunk_size=CHUNK_SIZE, use_mmap=True) -> str:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    if path == STDIN_PATH:
+        return hash_stream(sys.stdin.buffer, chunk_size).hexdigest()
+    with open(path, "rb") as f:
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            return hash_stream(f, chunk_size).hexdigest()
+        hasher = SHA256()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as data:
+                for i in range(0, len(data), chunk_size):
+                    hasher.update(data[i : i + chunk_size])
+        return hasher.hexdigest()
+
+
+def escape_path(path):
+    """(prefix, path) as sha256sum prints them: a name with a backslash or a line break gets a '\\' prefix."""
+
+    if not any(character in path for character in ESCAPED_CHARACTERS):
+        return "", path
+    return "\\", "".join(ESCAPED_CHARACTERS.get(character, character) for character in path)
+
+
+def get_check_display_path(path):
+    """sha256sum --check escapes a reported name only if it has a line break."""
+
+    return "".join(escape_path(path)) if "\n" in path or "\r" in path else path
+
+
+def unescape_path(path):
+    """Inverse of escape_path for the path part, None for an invalid escape sequence."""
+
+    characters = []
+    i = 0
+    while i < len(path):
+        if path[i] != "\\":
+            characters.append(path[i])
+            i += 1
+            continue
+        if path[i : i + 2] not in UNESCAPED_CHARACTERS:
+            return None
+        characters.append(UNESCAPED_CHARACTERS[path[i : i + 2]])
+        i += 2
+    return "".join(characters)
+
+
+def parse_checksum_line(line):
+    """'<hex>  <path>' or '<hex> *<path>', escaped as by escape_path -> (hex, path), None for a malformed line."""
+
+    line = line.rstrip("\n")
+    is_escaped = line.startswith("\\")
+    hex_digest, separator, path = line[is_escaped:].partition(" ")
+    if not separator or len(hex_digest) != 2 * SHA256.digest_size or not path or path[0] not in " *":
+        return None
+    path = unescape_path(path[1:]) if is_escaped else path[1:]
+    if path is None:
+        return None
+    return hex_digest.lower(), path
+
+
+def check_files(sums_path, chunk_size=CHUNK_SIZE, use_mmap=True, out=sys.stdout) -> bool:
+    n_failed = 0
+    n_unreadable = 0
+    n_malformed = 0
+    with (nullcontext(sys.stdin) if sums_path == STDIN_PATH else open(sums_path)) as sums_file:
+        for line in sums_file:
+            parsed_line = parse_checksum_line(line)
+            if parsed_line is None:
+                n_malformed += 1
+                continue
+            expected_hex_digest, path = parsed_line
+            try:
+                is_correct = hash_file(path, chunk_size, use_mmap) == expected_hex_digest
+            except OSError:
+                print(f"{get_check_display_path(path)}: FAILED open or read", file=out)
+                n_unreadable += 1
+                continue
+            print(f"{get_check_display_path(path)}: {'OK' if is_correct else 'FAILED'}", file=out)
+            n_failed += not is_correct
+
+    if n_malformed:
+        print(f"WARNING: {n_malformed} line(s) are improperly formatted", file=sys.stderr)
+    if n_unreadable:
+        print(f"WARNING: {n_unreadable} listed file(s) could not be read", file=sys.stderr)
+    if n_failed:
+        print(f"WARNING: {n_failed} computed checksum(s) did NOT match", file=sys.stderr)
+    return n_failed == 0 and n_unreadable == 0 and n_malformed == 0
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print or check SHA-256 checksums.")
+    parser.add_argument("paths", nargs="*", default=[STDIN_PATH], help="files to hash ('-' is stdin)")
+    parser.add_argument("-c", "--check", action="store_true", help="read checksums from the files and check them")
+    parser.add_argument(
+        "--chunk-size", type=positive_int, default=CHUNK_SIZE, help="bytes passed to the hasher at once"
+    )
+    parser.add_argument("--no-mmap", action="store_true", help="read files in chunks instead of mapping them")
+    args = parser.parse_args(argv)
+
+    is_successful = True
+    for path in args.paths:
+        if args.check:
+            is_successful &= check_files(path, args.chunk_size, not args.no_mmap)
+            continue
+        try:
+            hex_digest = hash_file(path, args.chunk_size, not args.no_mmap)
+            prefix, escaped_path = escape_path(path)
+            print(f"{prefix}{hex_digest}  {escaped_path}")
+        except OSError as error:
+            print(f"{path}: {error.strerror}", file=sys.stderr)
+            is_successful = False
+    return 0 if is_successful else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+from src.sha256.config import H, NUMBER_OF_BITS_WITH_MESSAGE_LENGTH
+from src.sha256.main import N_BYTES_IN_BLOCK, compress
+
+DIGEST_SIZE = 32
+N_BYTES_WITH_MESSAGE_LENGTH = NUMBER_OF_BITS_WITH_MESSAGE_LENGTH // 8
+
+
+class SHA256:
+    """Incremental SHA-256 with the hashlib interface that keeps less than one block of the message."""
+
+    name = "sha256"
+    digest_size = DIGEST_SIZE
+    block_size = N_BYTES_IN_BLOCK
+
+    def __init__(self, data=b""):
+        self.state = H
+        self.buffer = bytearray()
+        self.length = 0
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        data = memoryview(data).cast("B")
+        self.length += len(data)
+        position = 0
+        if self.buffer:
+            position = min(N_BYTES_IN_BLOCK - len(self.buffer), len(data))
+            self.buffer += data[:position]
+            if len(self.buffer) < N_BYTES_IN_BLOCK:
+                return
+            self.state = compress(self.state, self.buffer)
+            self.buffer = bytearray()
+
+        state = self.state
+        last_block_end = position + (len(data) - position) // N_BYTES_IN_BLOCK * N_BYTES_IN_BLOCK
+        for i in range(position, last_block_end, N_BYTES_IN_BLOCK):
+            state = compress(state, data[i : i + N_BYTES_IN_BLOCK])
+        self.state = state
+        self.buffer += data[last_block_end:]
+
+    def digest(self) -> bytes:
+        n_zeros = (N_BYTES_IN_BLOCK - N_BYTES_WITH_MESSAGE_LENGTH - len(self.buffer) - 1) % N_BYTES_IN_BLOCK
+        tail = (
+            bytes(self.buffer)
+            + b"\x80"
+            + bytes(n_zeros)
+            + (8 * self.length).to_bytes(N_BYTES_WITH_MESSAGE_LENGTH, "big")
+        )
+        state = self.state
+        for i in range(0, len(tail), N_BYTES_IN_BLOCK):
+            state = compress(state, tail[i : i + N_BYTES_IN_BLOCK])
+        return b"".join(word.to_bytes(4, "big") for word in state)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> "SHA256":
+        """An independent hasher with the same state, e.g. to fork the hash of a shared prefix."""
+
+        other = SHA256.__new__(SHA256)
+        other.state = self.state
+        other.buffer = bytearray(self.buffer)
+        other.length = self.length
+        return other
+
+
+def sha256_bytes(data) -> bytes:
+    return SHA256(data).digest()
@@ -0,0 +1,98 @@
+"""HMAC-SHA256 (RFC 2104) and HKDF-SHA256 (RFC 5869)."""
+
+from collections import defaultdict
+from secrets import compare_digest
+from typing import List, Sequence
+
+from src.sha256.hasher import SHA256, DIGEST_SIZE, sha256_bytes
+from src.sha256.main import N_BYTES_IN_BLOCK
+from src.sha256.vectorized import sha256_equal_length
+
+INNER_PAD_BYTE = 0x36
+OUTER_PAD_BYTE = 0x5C
+# smaller groups of equal-length messages are verified one by one
+MIN_MESSAGES_FOR_VECTORIZATION = 16
+MAX_HKDF_LENGTH = 255 * DIGEST_SIZE
+
+
+class HMACKey:
+    """A MAC key with the hasher states after the ipad and opad blocks computed once."""
+
+    digest_size = DIGEST_SIZE
+
+    def __init__(self, key: bytes):
+        key = bytes(key)
+        if len(key) > N_BYTES_IN_BLOCK:
+            key = sha256_bytes(key)
+        key = key.ljust(N_BYTES_IN_BLOCK, b"\x00")
+        self.inner_hasher = SHA256(bytes(byte ^ INNER_PAD_BYTE for byte in key))
+        self.outer_hasher = SHA256(bytes(byte ^ OUTER_PAD_BYTE for byte in key))
+
+    def new(self) -> SHA256:
+        """Inner hasher to feed a long message in parts, finish it with finalize()."""
+
+        return self.inner_hasher.copy()
+
+    def finalize(self, inner_hasher: SHA256) -> bytes:
+        outer_hasher = self.outer_hasher.copy()
+        outer_hasher.update(inner_hasher.digest())
+        return outer_hasher.digest()
+
+    def mac(self, message: bytes) -> bytes:
+        inner_hasher = self.new()
+        inner_hasher.update(message)
+        return self.finalize(inner_hasher)
+
+    def verify(self, message: bytes, tag: bytes) -> bool:
+        return compare_digest(self.mac(message), bytes(tag))
+
+    def mac_many(self, messages: Sequence[bytes]) -> List[bytes]:
+        """Groups of equal-length messages are hashed lane-parallel from the cached pad states."""
+
+        messages = [bytes(message) for message in messages]
+        indexes_by_length = defaultdict(list)
+        for i, message in enumerate(messages):
+            indexes_by_length[len(message)].append(i)
+
+        tags = [None] * len(messages)
+        for indexes in indexes_by_length.values():
+            if len(indexes) < MIN_MESSAGES_FOR_VECTORIZATION:
+                for i in indexes:
+                    tags[i] = self.mac(messages[i])
+                continue
+            inner_digests = sha256_equal_length(
+                [messages[i] for i in indexes], self.inner_hasher.state, N_BYTES_IN_BLOCK
+            )
+            group_tags = sha256_equal_length(inner_digests, self.outer_hasher.state, N_BYTES_IN_BLOCK)
+            for i, tag in zip(indexes, group_tags):
+                tags[i] = tag.tobytes()
+        return tags
+
+    def verify_many(self, messages: Sequence[bytes], tags: Sequence[bytes]) -> List[bool]:
+        if len(messages) != len(tags):
+            raise ValueError("Every message must have exactly one tag.")
+        return [compare_digest(expected, bytes(tag)) for expected, tag in zip(self.mac_many(messages), tags)]
+
+
+def hmac_sha256(key: bytes, message: bytes) -> bytes:
+    return HMACKey(key).mac(message)
+
+
+def hkdf_extract(salt: bytes, input_key_material: bytes) -> bytes:
+    return hmac_sha256(salt or bytes(DIGEST_SIZE), input_key_material)
+
+
+def hkdf_expand(pseudorandom_key: bytes, info: bytes, length: int) -> bytes:
+    if not 0 <= length <= MAX_HKDF_LENGTH:
+        raise ValueError(f"HKDF output length must be between 0 and {MAX_HKDF_LENGTH} bytes.")
+    key = HMACKey(pseudorandom_key)
+    blocks = []
+    block = b""
+    for i in range(1, -(-length // DIGEST_SIZE) + 1):
+        block = key.mac(block + bytes(info) + bytes([i]))
+        blocks.append(block)
+    return b"".join(blocks)[:length]
+
+
+def hkdf(input_key_material: bytes, length: int, salt: bytes = b"", info: bytes = b"") -> bytes:
+    return hkdf_expand(hkdf_extract(salt, input_key_material), info, length)
@@ -0,0 +1,85 @@
+"""SHA-256 of N equal-length messages at once, one uint32 lane per message."""
+
+import numpy as np
+
+from src.sha256.config import K, H, NUMBER_OF_ITERATIONS, NUMBER_OF_BITS_WITH_MESSAGE_LENGTH
+from src.sha256.main import N_BYTES_IN_BLOCK, N_WORDS_IN_BLOCK
+
+K_ARRAY = np.array(K, dtype=np.uint32)
+N_BYTES_WITH_MESSAGE_LENGTH = NUMBER_OF_BITS_WITH_MESSAGE_LENGTH // 8
+
+
+def right_rotate(words, shift_value):
+    return (words >> np.uint32(shift_value)) | (words << np.uint32(32 - shift_value))
+
+
+def to_messages_array(messages) -> np.ndarray:
+    """(N, L) uint8 array or a sequence of N bytes-like objects of the same length -> (N, L) uint8 array."""
+
+    if isinstance(messages, np.ndarray):
+        if messages.ndim != 2:
+            raise ValueError("Messages array must have shape (N, L).")
+        return messages.astype(np.uint8, copy=False)
+    messages = [bytes(message) for message in messages]
+    length = len(messages[0]) if messages else 0
+    if any(len(message) != length for message in messages):
+        raise ValueError("All messages must have the same length.")
+    return np.frombuffer(b"".join(messages), dtype=np.uint8).reshape(len(messages), length)
+
+
+def prepare_messages(messages: np.ndarray, n_prefix_bytes=0) -> np.ndarray:
+    """(N, L) uint8 -> (N, 16 * n_blocks) uint32 words, the length counts n_prefix_bytes absorbed bytes."""
+
+    n_messages, length = messages.shape
+    n_zeros = (N_BYTES_IN_BLOCK - N_BYTES_WITH_MESSAGE_LENGTH - length - 1) % N_BYTES_IN_BLOCK
+    total_length = n_prefix_bytes + length
+    tail = b"\x80" + bytes(n_zeros) + (8 * total_length).to_bytes(N_BYTES_WITH_MESSAGE_LENGTH, "big")
+
+    padded_messages = np.empty((n_messages, length + len(tail)), dtype=np.uint8)
+    padded_messages[:, :length] = messages
+    padded_messages[:, length:] = np.frombuffer(tail, dtype=np.uint8)
+    return padded_messages.view(">u4").astype(np.uint32)
+
+
+def expand_words(words):
+    for i in range(N_WORDS_IN_BLOCK, NUMBER_OF_ITERATIONS):
+        s0 = right_rotate(words[i - 15], 7) ^ right_rotate(words[i - 15], 18) ^ (words[i - 15] >> np.uint32(3))
+        s1 = right_rotate(words[i - 2], 17) ^ right_rotate(words[i - 2], 19) ^ (words[i - 2] >> np.uint32(10))
+        words.append(words[i - 16] + s0 + words[i - 7] + s1)
+
+
+def get_handled_supporting_vars(main_vars, words):
+    a, b, c, d, e, f, g, h = main_vars
+
+    for k_i, w_i in zip(K_ARRAY, words):
+        summ_0 = right_rotate(a, 2) ^ right_rotate(a, 13) ^ right_rotate(a, 22)
+        m_a = (a & b) ^ (a & c) ^ (b & c)
+        t2 = summ_0 + m_a
+        summ_1 = right_rotate(e, 6) ^ right_rotate(e, 11) ^ right_rotate(e, 25)
+        c_h = (e & f) ^ (~e & g)
+        t1 = h + summ_1 + c_h + k_i + w_i
+
+        # fmt: off
+        a, b, c, d, e, f, g, h = (
+            t1 + t2,
+            a, b, c,
+            d + t1,
+            e, f, g,
+        )
+        # fmt: on
+    return a, b, c, d, e, f, g, h
+
+
+def sha256_equal_length(messages, initial_state=H, n_prefix_bytes=0) -> np.ndarray:
+    """(N, 32) uint8 digests, initial_state is the midstate after n_prefix_bytes bytes of a common prefix."""
+
+    if n_prefix_bytes % N_BYTES_IN_BLOCK != 0:
+        raise ValueError(f"Prefix length must be a multiple of {N_BYTES_IN_BLOCK} bytes.")
+    words = prepare_messages(to_messages_array(messages), n_prefix_bytes)
+    state = [np.full(words.shape[0], word, dtype=np.uint32) for word in initial_state]
+    for block_start in range(0, words.shape[1], N_WORDS_IN_BLOCK):
+        block_words = [words[:, block_start + i] for i in range(N_WORDS_IN_BLOCK)]
+        expand_words(block_words)
+        handled_supporting_vars = get_handled_supporting_vars(state, block_words)
+        state = [n1 + n2 for n1, n2 in zip(state, handled_supporting_vars)]
+    return np.stack(state, axis=1).astype(">u4").view(np.uint8)
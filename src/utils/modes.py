@@ -0,0 +1,82 @@
+"""Modes of operation over block primitives, which must be picklable when used with n_workers."""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+BLOCKS_IN_TASK = 1024
+
+
+def pkcs7_pad(data: bytes, block_size: int) -> bytes:
+    n_appended_bytes = block_size - len(data) % block_size
+    return bytes(data) + bytes([n_appended_bytes]) * n_appended_bytes
+
+
+def pkcs7_unpad(data: bytes, block_size: int) -> bytes:
+    if len(data) == 0 or len(data) % block_size != 0:
+        raise ValueError(f"Padded data length must be a positive multiple of {block_size}.")
+    n_appended_bytes = data[-1]
+    padding = bytes([n_appended_bytes]) * n_appended_bytes
+    if not 1 <= n_appended_bytes <= block_size or data[-n_appended_bytes:] != padding:
+        raise ValueError("Invalid PKCS#7 padding.")
+    return bytes(data[:-n_appended_bytes])
+
+
+def xor_bytes(first_bytes: bytes, second_bytes: bytes) -> bytes:
+    """Both arguments must have the same length."""
+
+    return (int.from_bytes(first_bytes, "big") ^ int.from_bytes(second_bytes, "big")).to_bytes(len(first_bytes), "big")
+
+
+def ecb_apply(process_block, data: bytes, block_size: int) -> bytes:
+    return b"".join(process_block(data[i : i + block_size]) for i in range(0, len(data), block_size))
+
+
+def ecb_apply_parallel(process_block, data: bytes, block_size: int, n_workers=None, blocks_in_task=BLOCKS_IN_TASK):
+    """ecb_apply that splits data into tasks of blocks_in_task blocks for a process pool if n_workers is set."""
+
+    task_size = block_size * blocks_in_task
+    if n_workers is None or len(data) <= task_size:
+        return ecb_apply(process_block, data, block_size)
+    tasks = [data[i : i + task_size] for i in range(0, len(data), task_size)]
+    with ProcessPoolExecutor(n_workers) as executor:
+        return b"".join(executor.map(partial(ecb_apply, process_block, block_size=block_size), tasks))
+
+
+def ecb_encrypt(data: bytes, encrypt_block, block_size: int) -> bytes:
+    """PKCS#7 padding is always added."""
+
+    return ecb_apply(encrypt_block, pkcs7_pad(data, block_size), block_size)
+
+
+def ecb_decrypt(data: bytes, decrypt_block, block_size: int, n_workers=None, blocks_in_task=BLOCKS_IN_TASK) -> bytes:
+    if len(data) == 0 or len(data) % block_size != 0:
+        raise ValueError(f"Ciphertext length must be a positive multiple of {block_size}.")
+    return pkcs7_unpad(ecb_apply_parallel(decrypt_block, data, block_size, n_workers, blocks_in_task), block_size)
+
+
+def cbc_encrypt(data: bytes, iv: bytes, encrypt_block, block_size: int) -> bytes:
+    """PKCS#7 padding is always added."""
+
+    if len(iv) != block_size:
+        raise ValueError(f"IV must be exactly {block_size} bytes long.")
+    data = pkcs7_pad(data, block_size)
+    result = []
+    previous_block = bytes(iv)
+    for i in range(0, len(data), block_size):
+        previous_block = encrypt_block(xor_bytes(data[i : i + block_size], previous_block))
+        result.append(previous_block)
+    return b"".join(result)
+
+
+def cbc_decrypt(
+    data: bytes, iv: bytes, decrypt_block, block_size: int, n_workers=None, blocks_in_task=BLOCKS_IN_TASK
+) -> bytes:
+    """Blocks are decrypted independently, in a process pool if n_workers is set, then XORed in one pass."""
+
+    if len(iv) != block_size:
+        raise ValueError(f"IV must be exactly {block_size} bytes long.")
+    if len(data) == 0 or len(data) % block_size != 0:
+        raise ValueError(f"Ciphertext length must be a positive multiple of {block_size}.")
+    data = bytes(data)
+    decrypted_blocks = ecb_apply_parallel(decrypt_block, data, block_size, n_workers, blocks_in_task)
+    return pkcs7_unpad(xor_bytes(decrypted_blocks, bytes(iv) + data[:-block_size]), block_size)